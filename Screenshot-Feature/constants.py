@@ -22,4 +22,17 @@ WORDS = [
 
 # Game settings
 MAX_MISTAKES = 7
-MESSAGE_DISPLAY_TIME = 60
\ No newline at end of file
+MESSAGE_DISPLAY_TIME = 60
+
+# Screenshot settings
+SCREENSHOT_DIR = "screenshots"
+SCREENSHOT_FORMAT = "png"  # "png", "bmp" or "raw"
+PNG_COMPRESSION = 6  # zlib level, 0 (fastest) to 9 (smallest)
+SCREENSHOT_QUEUE_SIZE = 4  # Screenshots waiting to be written
+
+# Gameplay recorder settings
+RECORD_SECONDS = 10  # Length of the clip kept in memory
+RECORD_FPS = 15  # Recorded frames per second
+RECORD_WIDTH = 480  # Recorded frames are downscaled to this width
+RECORD_DIR = "recordings"
+RECORD_FORMAT = "gif"  # "gif" (needs Pillow, else PNG frames) or "png"
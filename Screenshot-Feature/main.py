@@ -5,11 +5,11 @@ Coordinates all components and runs the main game loop.
 
 import pygame
 import sys
-import os
-from datetime import datetime
 from constants import BACKGROUND
 from ui_components import FontManager, ButtonManager, BackgroundRenderer, GameRenderer
 from game_logic import GameLogic, InputHandler
+from screenshot_writer import ScreenshotWriter
+from recorder import GameplayRecorder
 
 class Game:
     """Main game class that coordinates all components"""
@@ -31,6 +31,8 @@ class Game:
         self.button_manager = ButtonManager(self.fonts, self.width, self.height)
         self.game_renderer = GameRenderer(self.fonts)
         self.input_handler = InputHandler()
+        self.screenshot_writer = ScreenshotWriter()
+        self.recorder = GameplayRecorder((self.width, self.height))
 
     def reset_game(self):
         """Reset the game to start a new round."""
@@ -38,20 +40,15 @@ class Game:
         self.button_manager.reset_buttons()
 
     def capture_screenshot(self):
-        """Capture a screenshot of the current game state."""
-        # Create screenshots directory if it doesn't exist
-        if not os.path.exists("screenshots"):
-            os.makedirs("screenshots")
-        
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"hangman_game_{timestamp}.png"
-        filepath = os.path.join("screenshots", filename)
-        
-        # Save the screenshot
-        pygame.image.save(self.screen, filepath)
-        print(f"Screenshot saved as: {filepath}")
-        return filepath
+        """Capture a screenshot of the current game state.
+
+        The screen is copied and written in the background.
+
+        Returns:
+            Path the screenshot will be saved to, or None if the writer is
+            too far behind and dropped it
+        """
+        return self.screenshot_writer.capture(self.screen)
 
     def run(self):
         """Main game loop."""
@@ -74,15 +71,20 @@ class Game:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_F12:  # F12 key for screenshot
                         self.capture_screenshot()
+                    elif event.key == pygame.K_F10:  # F10 saves the last seconds of play
+                        self.recorder.save()
 
             # Draw all game elements
             self.game_renderer.draw(self.screen, self.game_logic, self.button_manager, self.width, self.height)
+            self.recorder.capture(self.screen)
             
             # Update display
             pygame.display.flip()
             self.clock.tick(60)
 
-        # Clean up
+        # Clean up, finishing screenshots and clips still being written
+        self.screenshot_writer.close()
+        self.recorder.close()
         pygame.quit()
         sys.exit()
 
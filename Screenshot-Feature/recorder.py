@@ -0,0 +1,152 @@
+"""
+Gameplay Recorder Module for Hangman Game
+Keeps the last few seconds of gameplay in memory and saves them on request.
+
+Frames are downscaled to RECORD_WIDTH and copied into a ring buffer that is
+allocated once, so memory use is fixed no matter how long the game runs.
+Saving hands the buffer to a worker process that encodes a PNG sequence, or
+an animated GIF when Pillow is installed. The worker reads the buffer in
+place, so capture pauses until it has finished instead of copying the clip.
+"""
+
+import multiprocessing
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+import pygame
+from constants import RECORD_DIR, RECORD_FORMAT, RECORD_FPS, RECORD_SECONDS, RECORD_WIDTH
+from screenshot_writer import encode_png
+
+RECORD_FORMATS = ("png", "gif")
+
+
+def write_clip(buffer, shape, order, directory, image_format, fps):
+    """Worker process: write the frames of a clip in order.
+
+    Args:
+        buffer: Shared ring buffer of frames
+        shape: (frames, height, width, 3) shape of the buffer
+        order: Buffer indices of the clip's frames, oldest first
+        directory: Folder for the PNG sequence, or the GIF's path without
+            its extension
+        image_format: "png" for a PNG sequence or "gif"
+        fps: Frame rate the clip was recorded at
+    """
+    frames = np.frombuffer(buffer, dtype=np.uint8).reshape(shape)
+    height, width = shape[1:3]
+    if image_format == "gif":
+        try:
+            from PIL import Image
+        except ImportError:
+            print("Pillow is not installed, saving the clip as PNG frames instead")
+        else:
+            images = [Image.fromarray(frames[index]) for index in order]
+            path = f"{directory}.gif"
+            images[0].save(path, save_all=True, append_images=images[1:], duration=round(1000 / fps), loop=0)
+            print(f"Clip saved as: {path}")
+            return
+
+    os.makedirs(directory, exist_ok=True)
+    for number, index in enumerate(order, 1):
+        with open(os.path.join(directory, f"frame_{number:04d}.png"), "wb") as handle:
+            handle.write(encode_png(frames[index].tobytes(), width, height))
+    print(f"Clip saved to: {directory}")
+
+
+class GameplayRecorder:
+    """Ring buffer of the last `seconds` of downscaled frames."""
+
+    def __init__(self, screen_size, seconds=RECORD_SECONDS, fps=RECORD_FPS, width=RECORD_WIDTH,
+                 directory=RECORD_DIR, image_format=RECORD_FORMAT):
+        """Allocate the ring buffer.
+
+        Args:
+            screen_size: (width, height) of the screen being recorded
+            seconds: Length of the clip kept in memory
+            fps: Frames recorded per second, independent of the game's rate
+            width: Width frames are downscaled to, keeping the aspect ratio
+            directory: Folder clips are saved to
+            image_format: "png" for a PNG sequence or "gif" (needs Pillow)
+        """
+        if image_format not in RECORD_FORMATS:
+            raise ValueError(f"Unknown clip format {image_format!r}, expected one of {RECORD_FORMATS}")
+        screen_width, screen_height = screen_size
+        self.size = (width, max(1, round(width * screen_height / screen_width)))
+        self.fps = fps
+        self.directory = directory
+        self.image_format = image_format
+        self.shape = (seconds * fps, self.size[1], self.size[0], 3)
+        # Workers are spawned on every platform: forking this process would
+        # copy SDL's state and the screenshot writer's thread
+        self.context = multiprocessing.get_context("spawn")
+        # Shared with the worker process, so saving doesn't copy the clip
+        self.buffer = self.context.RawArray("B", int(np.prod(self.shape)))
+        self.frames = np.frombuffer(self.buffer, dtype=np.uint8).reshape(self.shape)
+        self.small = pygame.Surface(self.size)
+        self.index = 0  # Next slot to write
+        self.count = 0  # Slots holding a frame
+        self.next_capture = 0.0
+        self.worker = None
+
+    @property
+    def nbytes(self):
+        """Memory held by the ring buffer."""
+        return self.frames.nbytes
+
+    @property
+    def saving(self):
+        """True while a worker is writing a clip; capture is paused."""
+        if self.worker is not None and self.worker.exitcode is not None:
+            self.worker.join()
+            self.worker = None
+        return self.worker is not None
+
+    def capture(self, surface):
+        """Record the surface if a frame is due; call once per game frame.
+
+        Returns:
+            True if a frame was recorded
+        """
+        now = time.perf_counter()
+        if now < self.next_capture or self.saving:
+            return False
+        # Stay on the fps grid, without bursts after a slow frame
+        self.next_capture = max(self.next_capture + 1 / self.fps, now)
+
+        pygame.transform.scale(surface, self.size, self.small)
+        pixels = pygame.surfarray.pixels3d(self.small)  # (width, height, 3) view
+        self.frames[self.index] = pixels.transpose(1, 0, 2)
+        del pixels  # Unlock the surface
+        self.index = (self.index + 1) % len(self.frames)
+        self.count = min(self.count + 1, len(self.frames))
+        return True
+
+    def save(self):
+        """Start writing the recorded clip in a worker process.
+
+        Returns:
+            Path the clip is being written to, or None if there is nothing
+            to save or a clip is still being written
+        """
+        if self.count == 0 or self.saving:
+            return None
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.directory, f"hangman_clip_{timestamp}")
+        os.makedirs(self.directory, exist_ok=True)
+        start = (self.index - self.count) % len(self.frames)
+        order = [(start + offset) % len(self.frames) for offset in range(self.count)]
+        self.worker = self.context.Process(
+            target=write_clip, args=(self.buffer, self.shape, order, path, self.image_format, self.fps),
+            name="clip-writer")
+        self.worker.start()
+        # The next clip starts after this one
+        self.count = 0
+        return path
+
+    def close(self):
+        """Wait for a clip still being written."""
+        if self.worker is not None:
+            self.worker.join()
+            self.worker = None
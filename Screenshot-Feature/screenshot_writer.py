@@ -0,0 +1,157 @@
+"""
+Screenshot Writer Module for Hangman Game
+Saves screenshots on a background thread so the game never waits for disk.
+
+The game loop only copies the screen and queues the copy. A worker thread
+converts it to pixels, encodes it and writes the file. The queue is bounded,
+so at most `queue_size` frames are held in memory; when it is full a new
+screenshot either replaces the oldest waiting one or is dropped.
+"""
+
+import os
+import queue
+import struct
+import threading
+import zlib
+from datetime import datetime
+
+import pygame
+from constants import SCREENSHOT_DIR, SCREENSHOT_FORMAT, PNG_COMPRESSION, SCREENSHOT_QUEUE_SIZE
+
+FORMATS = ("png", "bmp", "raw")
+DROP_POLICIES = ("oldest", "newest")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def png_chunk(kind, data):
+    """Pack one PNG chunk: length, type, data and CRC."""
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(pixels, width, height, compression=PNG_COMPRESSION):
+    """Encode RGB pixels as a PNG.
+
+    Rows are stored unfiltered; zlib does all the work, at the given level.
+
+    Args:
+        pixels: width * height * 3 bytes of RGB, row by row
+        width: Image width in pixels
+        height: Image height in pixels
+        compression: zlib level, 0 (fastest, largest) to 9 (slowest, smallest)
+
+    Returns:
+        The PNG file as bytes
+    """
+    stride = width * 3
+    # Each row starts with its filter type, 0 for none
+    rows = b"".join(b"\x00" + pixels[row * stride:(row + 1) * stride] for row in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)  # 8-bit RGB
+    return (PNG_SIGNATURE + png_chunk(b"IHDR", header)
+            + png_chunk(b"IDAT", zlib.compress(rows, compression)) + png_chunk(b"IEND", b""))
+
+
+class ScreenshotWriter:
+    """Background writer for screenshots with a bounded queue."""
+
+    def __init__(self, directory=SCREENSHOT_DIR, image_format=SCREENSHOT_FORMAT, compression=PNG_COMPRESSION,
+                 queue_size=SCREENSHOT_QUEUE_SIZE, drop="oldest"):
+        """Start the writer thread.
+
+        Args:
+            directory: Folder the screenshots are written to
+            image_format: "png", "bmp" (no compression, fast) or "raw"
+                (RGB bytes with the size in the file name, fastest)
+            compression: zlib level for PNG, 0 to 9
+            queue_size: Screenshots waiting to be written before dropping
+            drop: When the queue is full, "oldest" replaces the oldest
+                waiting screenshot and "newest" drops the new one
+        """
+        if image_format not in FORMATS:
+            raise ValueError(f"Unknown screenshot format {image_format!r}, expected one of {FORMATS}")
+        if drop not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy {drop!r}, expected one of {DROP_POLICIES}")
+        self.directory = directory
+        self.image_format = image_format
+        self.compression = compression
+        self.drop = drop
+        self.queue = queue.Queue(queue_size)
+        self.count = 0
+        self.dropped = 0
+        self.written = []
+        self.thread = threading.Thread(target=self.work, name="screenshot-writer", daemon=True)
+        self.thread.start()
+
+    def capture(self, surface):
+        """Queue a copy of the surface to be saved; never blocks.
+
+        Args:
+            surface: Surface to capture, usually the screen
+
+        Returns:
+            Path the screenshot will be written to, or None if it was dropped;
+            with drop="oldest" a later capture can still replace it
+        """
+        self.count += 1
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"hangman_game_{timestamp}_{self.count:03d}"
+        if self.image_format == "raw":
+            width, height = surface.get_size()
+            filename += f"_{width}x{height}.rgb"
+        else:
+            filename += f".{self.image_format}"
+        filepath = os.path.join(self.directory, filename)
+
+        if self.drop == "newest" and self.queue.full():
+            self.dropped += 1
+            return None
+        job = (surface.copy(), filepath)
+        while True:
+            try:
+                self.queue.put_nowait(job)
+                return filepath
+            except queue.Full:
+                # Make room by dropping the oldest screenshot still waiting
+                try:
+                    self.queue.get_nowait()
+                    self.queue.task_done()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def work(self):
+        """Writer thread: save queued screenshots until close() sends None."""
+        while True:
+            job = self.queue.get()
+            try:
+                if job is None:
+                    return
+                self.save(*job)
+            finally:
+                self.queue.task_done()
+
+    def save(self, surface, filepath):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if self.image_format == "bmp":
+                pygame.image.save(surface, filepath)
+            else:
+                pixels = pygame.image.tobytes(surface, "RGB")
+                if self.image_format == "png":
+                    pixels = encode_png(pixels, *surface.get_size(), self.compression)
+                with open(filepath, "wb") as handle:
+                    handle.write(pixels)
+        except (OSError, pygame.error) as error:
+            print(f"Could not save screenshot {filepath}: {error}")
+            return
+        self.written.append(filepath)
+        print(f"Screenshot saved as: {filepath}")
+
+    def flush(self):
+        """Wait until every queued screenshot is written."""
+        self.queue.join()
+
+    def close(self):
+        """Write the queued screenshots and stop the writer thread."""
+        self.queue.put(None)
+        self.thread.join()
@@ -0,0 +1,75 @@
+"""
+Adversarial Game Logic Module for Hangman Game
+An "evil" mode where the computer never commits to a word.
+
+Every word of the chosen length stays a candidate. On each guess the
+candidates are split into families by where the guessed letter appears, and
+the largest family survives. Families come from the precomputed position
+masks of the pattern-query length table, so a guess is one array gather and
+one count over the remaining candidates.
+"""
+
+import random
+
+import numpy as np
+
+from game_logic import GameLogic, letter_bit
+from pattern_query import PatternQuery, largest_family
+
+
+class AdversarialGameLogic(GameLogic):
+    """GameLogic that keeps the largest family of words consistent with the
+    guesses instead of a fixed word.
+
+    self.word always holds one member of the surviving family, so display,
+    win/lose detection and rendering work exactly as in the normal mode."""
+
+    def __init__(self, word_source=None, difficulty=None, selector=None, query=None):
+        """Initialize adversarial game logic and start a new game.
+
+        Args:
+            word_source: WordSource to pick words from, defaults to WORDS
+            difficulty: Optional difficulty band name for the first word,
+                which decides the word length
+            selector: Optional WordSelector for the first word
+            query: Optional PatternQuery to share length tables with
+        """
+        self.query = query if query is not None else PatternQuery(word_source)
+        super().__init__(self.query.word_source, difficulty, selector)
+
+    def reset_game(self):
+        """Reset the game; every word with the new word's length is a candidate."""
+        super().reset_game()
+        self.table = self.query.table(len(self.word))
+        self.table.position_masks  # Build them now, so no guess pays for it
+        self.rows = None  # None means every row of the table
+        self.word_row = None
+
+    def candidate_count(self):
+        return len(self.table) if self.rows is None else len(self.rows)
+
+    def guess_letter(self, letter):
+        """Process a guess, keeping the largest family of candidates.
+
+        Args:
+            letter: The letter being guessed (uppercase)
+        """
+        if self.guessed_mask & letter_bit(letter) or self.game_state != "playing":
+            return
+
+        keys = self.table.position_masks[ord(letter) - 65]
+        if self.rows is not None:
+            keys = keys[self.rows]
+        family, size = largest_family(keys, self.table.length)
+
+        members = keys == family
+        self.rows = np.flatnonzero(members) if self.rows is None else np.compress(members, self.rows)
+
+        # Swap in a member of the family if the shown word just dropped out
+        word_row = self.word_row
+        if word_row is None or self.table.position_masks[ord(letter) - 65, word_row] != family:
+            word_row = int(self.rows[random.randrange(size)])
+            self.word_row = word_row
+            self.load_word(self.query.word_source.word(int(self.table.ids[word_row])))
+
+        super().guess_letter(letter)
@@ -0,0 +1,240 @@
+"""
+Performance benchmarks for the Hangman game.
+Measures game logic throughput, input handling and rendering on offscreen
+surfaces with the SDL dummy video driver, so it runs the same on a desktop,
+a kiosk or a CI machine without a display. Every benchmark uses fixed seeds.
+
+Run from the repository root, saving the results and comparing them with a
+previous run:
+    python benchmarks/performance.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from constants import BACKGROUND  # noqa: E402
+from game_logic import ALPHABET, GameLogic  # noqa: E402
+from ui_components import FontManager, ButtonManager, BackgroundRenderer, GameRenderer  # noqa: E402
+
+SEED = 1234
+RESOLUTIONS = {"1080p": (1920, 1080), "1440p": (2560, 1440), "4k": (3840, 2160)}
+
+# Relative slowdown reported as a regression by --compare
+DEFAULT_THRESHOLD = 0.10
+
+
+def measure(operation, operations_per_run, repeat):
+    """Time a benchmark body several times.
+
+    Args:
+        operation: Callable running `operations_per_run` operations
+        operations_per_run: Operations done by one call, to get per-op times
+        repeat: Number of timed calls; the first, warm-up call isn't counted
+
+    Returns:
+        Dict with the median and best time per operation in microseconds
+    """
+    operation()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        times.append((time.perf_counter() - start) / operations_per_run * 1e6)
+    return {"unit": "us/op", "median": statistics.median(times), "min": min(times), "repeat": repeat}
+
+
+def bench_logic(repeat):
+    """GameLogic guess, reset and display-word throughput."""
+    rng = random.Random(SEED)
+    orders = [rng.sample(ALPHABET, len(ALPHABET)) for _ in range(200)]
+    random.seed(SEED)
+    game = GameLogic()
+    guesses = [0]
+
+    def play_games():
+        random.seed(SEED)
+        count = 0
+        for order in orders:
+            game.reset_game()
+            for letter in order:
+                if game.is_game_over():
+                    break
+                game.guess_letter(letter)
+                count += 1
+        guesses[0] = count
+
+    play_games()  # Count the guesses one run makes
+
+    def resets():
+        random.seed(SEED)
+        for _ in range(1000):
+            game.reset_game()
+
+    def display_words():
+        for _ in range(10000):
+            game.get_display_word()
+
+    return {
+        "logic.guess_letter": measure(play_games, guesses[0], repeat),
+        "logic.reset_game": measure(resets, 1000, repeat),
+        "logic.get_display_word": measure(display_words, 10000, repeat),
+    }
+
+
+def bench_buttons(repeat):
+    """ButtonManager.handle_events cost per event, over clicks, misses and motion."""
+    fonts = FontManager()
+    width, height = RESOLUTIONS["1080p"]
+    button_manager = ButtonManager(fonts, width, height)
+    rng = random.Random(SEED)
+    events = []
+    for _ in range(1000):
+        kind = rng.random()
+        if kind < 0.4:
+            button = rng.choice(button_manager.buttons)
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=button.rect.center))
+        elif kind < 0.6:
+            position = (rng.randrange(width), rng.randrange(height))
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=position))
+        else:
+            position = (rng.randrange(width), rng.randrange(height))
+            events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=position, rel=(0, 0), buttons=(0, 0, 0)))
+
+    def handle():
+        button_manager.reset_buttons()
+        for event in events:
+            button_manager.handle_events(event)
+
+    return {"buttons.handle_events": measure(handle, len(events), repeat)}
+
+
+def bench_background(repeat):
+    """BackgroundRenderer.draw_decorations per frame at each resolution."""
+    results = {}
+    for name, size in RESOLUTIONS.items():
+        surface = pygame.Surface(size).convert()
+        background = BackgroundRenderer(*size)
+        frame_times = [frame / 60 for frame in range(60)]
+
+        def draw():
+            for current_time in frame_times:
+                background.draw_decorations(surface, current_time)
+
+        results[f"background.draw_decorations.{name}"] = measure(draw, len(frame_times), repeat)
+    return results
+
+
+def bench_frame(repeat):
+    """A full frame: clear, background and GameRenderer.draw at 1080p."""
+    width, height = RESOLUTIONS["1080p"]
+    surface = pygame.Surface((width, height)).convert()
+    fonts = FontManager()
+    random.seed(SEED)
+    game = GameLogic()
+    for letter in "ETAO":
+        game.guess_letter(letter)
+    button_manager = ButtonManager(fonts, width, height)
+    renderer = GameRenderer(fonts)
+    background = BackgroundRenderer(width, height)
+    frame_times = [frame / 60 for frame in range(60)]
+
+    def frames():
+        for current_time in frame_times:
+            surface.fill(BACKGROUND)
+            background.draw_decorations(surface, current_time)
+            renderer.draw(surface, game, button_manager, width, height)
+
+    return {"frame.full.1080p": measure(frames, len(frame_times), repeat)}
+
+
+BENCHMARKS = {"logic": bench_logic, "buttons": bench_buttons, "background": bench_background, "frame": bench_frame}
+
+
+def run(names, repeat):
+    """Run benchmark groups and collect their results with the environment."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # Needed to convert surfaces to the display format
+    results = {}
+    for name in names:
+        results.update(BENCHMARKS[name](repeat))
+    pygame.quit()
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "video_driver": os.environ["SDL_VIDEODRIVER"],
+        },
+        "seed": SEED,
+        "results": results,
+    }
+
+
+def compare(current, previous, threshold):
+    """Print how each benchmark changed against a previous run.
+
+    Returns:
+        List of benchmark names that got slower by more than threshold
+    """
+    regressions = []
+    print(f"{'benchmark':<36}{'before':>12}{'after':>12}{'change':>10}")
+    for name, result in current["results"].items():
+        before = previous["results"].get(name)
+        if before is None:
+            print(f"{name:<36}{'-':>12}{result['median']:12.3f}{'new':>10}")
+            continue
+        change = result["median"] / before["median"] - 1
+        flag = "  SLOWER" if change > threshold else ""
+        print(f"{name:<36}{before['median']:12.3f}{result['median']:12.3f}{change:+10.1%}{flag}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    """Command line entry point for the performance benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark Hangman game logic, input and rendering.")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), default=list(BENCHMARKS),
+                        help="benchmark groups to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=7, help="timed runs per benchmark")
+    parser.add_argument("--output", help="save the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file from a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown that fails --compare (default: 0.10)")
+    args = parser.parse_args()
+
+    current = run(args.only, args.repeat)
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(current, handle, indent=2)
+
+    if args.compare:
+        with open(args.compare) as handle:
+            previous = json.load(handle)
+        regressions = compare(current, previous, args.threshold)
+        if regressions:
+            sys.exit(f"Slower than the previous run: {', '.join(regressions)}")
+    else:
+        print(json.dumps(current["results"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Startup benchmark for the Hangman game core.
+Measures how long a fresh interpreter takes to import game_logic and start
+a game, and checks that no heavy dependency gets pulled in on the way.
+
+Run from the repository root:
+    python benchmarks/startup.py --runs 20 --budget-ms 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside each fresh interpreter; prints its own timing as JSON
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from game_logic import GameLogic
+imported = time.perf_counter()
+game = GameLogic()
+game.guess_letter("E")
+constructed = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "total_ms": (constructed - start) * 1000,
+    "heavy_modules": sorted(name for name in ("pygame", "numpy") if name in sys.modules),
+}))
+"""
+
+
+def measure(runs):
+    """Start `runs` fresh interpreters and collect their timings.
+
+    Returns:
+        Dict with median and worst import and import+construct times in
+        milliseconds, and any heavy modules that were imported
+    """
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, check=True,
+                                capture_output=True, text=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    import_times = [sample["import_ms"] for sample in samples]
+    total_times = [sample["total_ms"] for sample in samples]
+    return {
+        "runs": runs,
+        "import_ms_median": statistics.median(import_times),
+        "total_ms_median": statistics.median(total_times),
+        "total_ms_max": max(total_times),
+        "heavy_modules": sorted({name for sample in samples for name in sample["heavy_modules"]}),
+    }
+
+
+def main():
+    """Command line entry point for the startup benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark importing and constructing GameLogic.")
+    parser.add_argument("--runs", type=int, default=20, help="fresh interpreters to start")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="fail if the median import+construct time exceeds this")
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+    print(json.dumps(result, indent=2))
+
+    if result["heavy_modules"]:
+        sys.exit(f"game_logic pulled in {', '.join(result['heavy_modules'])}")
+    if args.budget_ms is not None and result["total_ms_median"] > args.budget_ms:
+        sys.exit(f"Median startup {result['total_ms_median']:.2f} ms is over the {args.budget_ms} ms budget")
+
+
+if __name__ == "__main__":
+    main()
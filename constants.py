@@ -10,6 +10,10 @@ BUTTON_HOVER = (100, 160, 210)
 RED = (220, 60, 60)
 GREEN = (70, 180, 70)
 LIGHT_BLUE = (100, 180, 255)
+DISABLED_TEXT = (150, 150, 165)
+
+# Colors of the static screen layer: background, accent, instruction text
+THEME = (BACKGROUND, ACCENT, LIGHT_BLUE)
 
 # Game words
 WORDS = [
@@ -22,4 +26,32 @@ WORDS = [
 
 # Game settings
 MAX_MISTAKES = 7
-MESSAGE_DISPLAY_TIME = 60
\ No newline at end of file
+MESSAGE_DISPLAY_TIME = 60  # In game ticks
+
+# Fixed game updates per second, independent of the frame rate, and the
+# most ticks a single frame may catch up on after a stall (time the frame
+# pacer waits on purpose always counts in full)
+TICK_RATE = 60
+MAX_CATCH_UP_TICKS = 15
+
+# Frame pacing: full rate, idle rate (0 sleeps until input) and the
+# time without input before the game idles
+TARGET_FPS = 60
+IDLE_FPS = 10
+IDLE_AFTER_MS = 3000
+
+# Frames of stage timings kept by the profiler (--profile)
+PROFILE_WINDOW = 600
+
+# Rendered text surfaces kept by FontManager.render()
+TEXT_CACHE_SIZE = 256
+
+# Background stars (up to about 10,000) and the seed of their layout
+STAR_COUNT = 100
+BACKGROUND_SEED = 2024
+
+# Moving shapes above which DirtyRectRenderer presents whole frames
+DIRTY_RECT_LIMIT = 400
+
+# Label of the hint button in the letter grid
+HINT_LABEL = "?"
\ No newline at end of file
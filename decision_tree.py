@@ -0,0 +1,269 @@
+"""
+Decision Tree Module for Hangman Game
+Precomputes the guesser's best move for every reachable game state.
+
+An offline build walks every game a greedy minimax guesser can play against
+a dictionary: at each state it picks the letter whose largest resulting
+family of words is smallest, then follows every family. The moves are stored
+in an open-addressing hash table keyed by (word length, guess mask, revealed
+pattern) and written to a compact binary file. At runtime the file is
+memory-mapped, so loading costs almost nothing and a lookup is O(1).
+
+The build is split across processes by first guess: the families produced
+by each length's first guess are independent subtrees.
+"""
+
+import argparse
+import hashlib
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from constants import MAX_MISTAKES
+from game_logic import ALPHABET
+from pattern_query import PatternQuery
+from word_source import load_word_source
+
+TREE_MAGIC = b"HMTREE01"
+TREE_HEADER = struct.Struct("<8sIIQQ16s")  # magic, max mistakes, reserved, slots, entries, fingerprint
+
+HIDDEN = ord("_")
+
+
+def state_key(length, guessed_mask, pattern):
+    """Hash a game state into a non-zero 64-bit table key.
+
+    Args:
+        length: Word length
+        guessed_mask: Mask of the letters guessed so far
+        pattern: Bytes with the revealed letter or "_" per position
+
+    Returns:
+        Integer key; 0 is reserved for empty slots
+    """
+    data = struct.pack("<BI", length, guessed_mask) + bytes(pattern)
+    key = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+    return key or 1
+
+
+def choose_letter(position_masks, guessed_mask):
+    """Pick the greedy minimax guess for a set of candidate words.
+
+    The chosen letter minimizes the size of the largest family it can leave,
+    preferring letters found in more candidates on ties.
+
+    Args:
+        position_masks: uint32 array (26, candidates), see LengthTable.position_masks
+        guessed_mask: Mask of the letters already guessed
+
+    Returns:
+        Letter index (0 = A)
+    """
+    count = position_masks.shape[1]
+    if count == 1:
+        # A single candidate: guess its letters in alphabetical order
+        for letter in np.flatnonzero(position_masks[:, 0]):
+            if not guessed_mask >> int(letter) & 1:
+                return int(letter)
+        return None
+
+    best, best_score = None, None
+    for letter in range(26):
+        if guessed_mask >> letter & 1:
+            continue
+        keys = position_masks[letter]
+        misses = count - np.count_nonzero(keys)
+        if misses == count:
+            continue  # No candidate has this letter
+        worst = int(np.unique(keys, return_counts=True)[1].max())
+        score = (worst, misses)
+        if best_score is None or score < best_score:
+            best, best_score = letter, score
+    return best
+
+
+def expand(position_masks, guessed_mask, pattern, mistakes, max_mistakes, entries):
+    """Add the moves of the subtree rooted at a game state to entries.
+
+    Args:
+        position_masks: uint32 array (26, candidates) for the state's candidates
+        guessed_mask: Mask of the letters guessed so far
+        pattern: bytearray with the revealed letter or "_" per position
+        mistakes: Misses so far
+        max_mistakes: Misses that lose the game
+        entries: List the (key, letter index) moves are appended to
+    """
+    if mistakes >= max_mistakes or HIDDEN not in pattern:
+        return  # Lost or solved
+    letter = choose_letter(position_masks, guessed_mask)
+    if letter is None:
+        return
+    entries.append((state_key(len(pattern), guessed_mask, pattern), letter))
+
+    keys = position_masks[letter]
+    next_mask = guessed_mask | (1 << letter)
+    for family in np.unique(keys):
+        members = keys == family
+        next_pattern = bytearray(pattern)
+        for position in range(len(pattern)):
+            if family >> position & 1:
+                next_pattern[position] = 65 + letter
+        expand(position_masks[:, members], next_mask, next_pattern, mistakes + (family == 0),
+               max_mistakes, entries)
+
+
+def expand_task(position_masks, guessed_mask, pattern, mistakes, max_mistakes):
+    """Worker entry point: build one first-guess subtree."""
+    entries = []
+    expand(position_masks, guessed_mask, bytearray(pattern), mistakes, max_mistakes, entries)
+    return entries
+
+
+def build_entries(word_source, max_mistakes=MAX_MISTAKES, processes=None):
+    """Compute every move of the greedy minimax guesser.
+
+    Args:
+        word_source: WordSource with the dictionary
+        max_mistakes: Misses that lose a game
+        processes: Worker processes, defaults to the CPU count; 1 runs inline
+
+    Returns:
+        List of (key, letter index) moves
+    """
+    query = PatternQuery(word_source)
+    entries = []
+    tasks = []
+    for length in np.unique(np.asarray(word_source.lengths)):
+        length = int(length)
+        position_masks = query.table(length).position_masks
+        pattern = bytes([HIDDEN]) * length
+        letter = choose_letter(position_masks, 0)
+        if letter is None:
+            continue
+        entries.append((state_key(length, 0, pattern), letter))
+
+        # Each family left by the first guess is an independent subtree
+        keys = position_masks[letter]
+        for family in np.unique(keys):
+            next_pattern = bytes(65 + letter if family >> position & 1 else HIDDEN for position in range(length))
+            tasks.append((position_masks[:, keys == family], 1 << letter, next_pattern,
+                          int(family == 0), max_mistakes))
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        for task in tasks:
+            entries.extend(expand_task(*task))
+        return entries
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for subtree in executor.map(expand_task, *zip(*tasks)):
+            entries.extend(subtree)
+    return entries
+
+
+def write_tree(path, entries, max_mistakes, fingerprint):
+    """Write moves to a decision tree file.
+
+    Args:
+        path: Output file path
+        entries: List of (key, letter index) moves
+        max_mistakes: Misses that lose a game, stored for validation
+        fingerprint: Dictionary fingerprint, stored for validation
+    """
+    slot_count = 1
+    while slot_count < 2 * len(entries):
+        slot_count *= 2
+    keys = np.zeros(slot_count, dtype="<u8")
+    values = np.zeros(slot_count, dtype=np.uint8)
+    for key, letter in entries:
+        slot = key & (slot_count - 1)
+        while keys[slot] and keys[slot] != key:
+            slot = (slot + 1) & (slot_count - 1)
+        keys[slot] = key
+        values[slot] = letter
+
+    with open(path, "wb") as handle:
+        handle.write(TREE_HEADER.pack(TREE_MAGIC, max_mistakes, 0, slot_count, len(entries), fingerprint))
+        handle.write(keys.tobytes())
+        handle.write(values.tobytes())
+
+
+class DecisionTree:
+    """Memory-mapped decision tree for O(1) best-guess lookups."""
+
+    def __init__(self, path, word_source=None, max_mistakes=MAX_MISTAKES):
+        """Map a decision tree file.
+
+        Args:
+            path: Path of a file written by write_tree()
+            word_source: Optional WordSource the tree must have been built for
+            max_mistakes: Misses that lose a game, must match the build
+
+        Raises:
+            ValueError: If the file is not a tree or was built for another
+                dictionary or mistake limit
+        """
+        with open(path, "rb") as handle:
+            header = handle.read(TREE_HEADER.size)
+        if len(header) != TREE_HEADER.size:
+            raise ValueError(f"{path} is not a decision tree file")
+        magic, tree_mistakes, _, slot_count, entry_count, fingerprint = TREE_HEADER.unpack(header)
+        if magic != TREE_MAGIC:
+            raise ValueError(f"{path} is not a decision tree file")
+        if tree_mistakes != max_mistakes:
+            raise ValueError(f"{path} was built for {tree_mistakes} mistakes, not {max_mistakes}")
+        if word_source is not None and fingerprint != word_source.fingerprint():
+            raise ValueError(f"{path} was built for a different dictionary")
+
+        self.slot_count = slot_count
+        self.entry_count = entry_count
+        self.keys = np.memmap(path, dtype="<u8", mode="r", offset=TREE_HEADER.size, shape=(slot_count,))
+        self.values = np.memmap(path, dtype=np.uint8, mode="r", offset=TREE_HEADER.size + slot_count * 8,
+                                shape=(slot_count,))
+
+    def lookup(self, length, guessed_mask, pattern):
+        """Get the stored move for a game state.
+
+        Returns:
+            Uppercase letter, or None if the state isn't in the tree
+        """
+        key = state_key(length, guessed_mask, pattern)
+        slot = key & (self.slot_count - 1)
+        while True:
+            stored = int(self.keys[slot])
+            if stored == key:
+                return ALPHABET[self.values[slot]]
+            if not stored:
+                return None
+            slot = (slot + 1) & (self.slot_count - 1)
+
+    def best_guess(self, game_logic):
+        """Get the tree's move for the current state of a game.
+
+        Returns:
+            Uppercase letter, or None if the state isn't in the tree (e.g. the
+            word isn't in the tree's dictionary)
+        """
+        pattern = "".join(cell[0] for cell in game_logic.revealed).encode("ascii")
+        return self.lookup(len(pattern), game_logic.guessed_mask, pattern)
+
+
+def main():
+    """Command line entry point for building decision trees."""
+    parser = argparse.ArgumentParser(description="Build a Hangman decision tree file.")
+    parser.add_argument("output", help="decision tree file to write")
+    parser.add_argument("--words", help="dictionary file with one word per line (default: built-in list)")
+    parser.add_argument("--max-mistakes", type=int, default=MAX_MISTAKES)
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    word_source = load_word_source(args.words)
+    entries = build_entries(word_source, args.max_mistakes, args.processes)
+    write_tree(args.output, entries, args.max_mistakes, word_source.fingerprint())
+    print(f"Wrote {len(entries)} states to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Difficulty Module for Hangman Game
+Scores every word by how well a reference solver does against it.
+
+The reference solver guesses the letter found in the most remaining
+candidate words, breaking ties at random. Because it only sees the pattern,
+all words of one length can be played at once: each guess splits the words
+into families that are followed separately, so a whole length group costs
+one walk of its guess tree per round. Several rounds with different tie
+breaks give each word an expected number of mistakes and a win probability.
+
+Scores are cached per length group, keyed by a fingerprint of the group's
+words. When the dictionary changes only the groups that changed are scored
+again, and the cache is written after every finished group so an
+interrupted run resumes where it stopped.
+"""
+
+import argparse
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from constants import MAX_MISTAKES
+from pattern_query import PatternQuery, letter_counts
+from word_source import DIFFICULTY_BANDS, load_word_source
+
+DEFAULT_ROUNDS = 8
+CACHE_SUFFIX = ".difficulty.npz"
+
+# Part of every cached group's fingerprint; bump when scoring changes
+SCORING_VERSION = 2
+
+# Smaller word sources are scored inline, faster than starting a process pool
+INLINE_WORD_LIMIT = 10_000
+
+
+def play_group(position_masks, masks, length, max_mistakes, seed):
+    """Play the reference solver against every word of one length.
+
+    Args:
+        position_masks: uint32 array (26, words), see LengthTable.position_masks
+        masks: uint32 array of the words' letter masks
+        length: Word length
+        max_mistakes: Misses that lose a game
+        seed: Seed for the solver's tie breaks
+
+    Returns:
+        Tuple of (mistakes, won) arrays, one entry per word
+    """
+    rng = np.random.default_rng(seed)
+    mistakes = np.zeros(len(masks), dtype=np.uint8)
+    won = np.zeros(len(masks), dtype=bool)
+    solved = (1 << length) - 1
+
+    # Each entry is a family of words the solver can't tell apart yet
+    stack = [(np.arange(len(masks)), 0, 0, 0)]
+    while stack:
+        rows, guessed_mask, revealed, misses = stack.pop()
+        if misses >= max_mistakes:
+            # Lost, even if this miss narrowed the family to one word
+            mistakes[rows] = misses
+            continue
+        if revealed == solved or len(rows) == 1:
+            # Solved, or a single candidate whose letters are all hits
+            mistakes[rows] = misses
+            won[rows] = True
+            continue
+
+        counts = letter_counts(masks[rows]) + rng.random(26) * 0.5
+        counts[(guessed_mask >> np.arange(26)) & 1 == 1] = -1
+        letter = int(counts.argmax())
+
+        keys = position_masks[letter, rows]
+        for family in np.unique(keys):
+            family = int(family)
+            stack.append((rows[keys == family], guessed_mask | (1 << letter), revealed | family,
+                          misses + (family == 0)))
+    return mistakes, won
+
+
+def group_fingerprint(table, rounds, max_mistakes):
+    """Get a digest of a length group's words and the scoring settings."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.array([SCORING_VERSION, table.length, rounds, max_mistakes], dtype="<i4").tobytes())
+    digest.update(np.ascontiguousarray(table.letters).tobytes())
+    return digest.digest()
+
+
+def score_task(length, position_masks, masks, max_mistakes, seed):
+    """Worker entry point: play one round against one length group."""
+    mistakes, won = play_group(position_masks, masks, length, max_mistakes, seed)
+    return length, mistakes, won
+
+
+class DifficultyIndex:
+    """Per-word expected mistakes and win probabilities for a word source."""
+
+    def __init__(self, word_source, expected_mistakes, win_probability, max_mistakes=MAX_MISTAKES):
+        self.word_source = word_source
+        self.expected_mistakes = expected_mistakes
+        self.win_probability = win_probability
+        self.max_mistakes = max_mistakes
+
+    def scores(self):
+        """Get one number per word, higher is harder.
+
+        A loss weighs as much as one more mistake than the limit allows.
+        """
+        return self.expected_mistakes + (1.0 - self.win_probability) * (self.max_mistakes + 1)
+
+    def bands(self):
+        """Split the words into equally sized DIFFICULTY_BANDS by score.
+
+        Returns:
+            uint8 array of indices into DIFFICULTY_BANDS
+        """
+        ranks = np.argsort(np.argsort(self.scores(), kind="stable"), kind="stable")
+        return (ranks * len(DIFFICULTY_BANDS) // max(len(ranks), 1)).astype(np.uint8)
+
+    def apply(self):
+        """Make the word source pick words by these difficulty bands."""
+        self.word_source.set_bands(self.bands())
+
+
+def default_cache_path(word_source):
+    """Get the cache path next to a dictionary file, or None for in-memory lists."""
+    path = getattr(word_source, "path", None)
+    return path + CACHE_SUFFIX if path else None
+
+
+def load_cache(cache_path):
+    """Read cached group scores.
+
+    Returns:
+        Dict mapping group fingerprint to (mistakes, win probability) arrays
+    """
+    try:
+        with np.load(cache_path) as cache:
+            fingerprints = cache["fingerprints"]
+            offsets = cache["offsets"]
+            mistakes = cache["mistakes"]
+            wins = cache["wins"]
+    except (OSError, ValueError, KeyError):
+        return {}
+    groups = {}
+    for index, fingerprint in enumerate(fingerprints):
+        start, end = offsets[index], offsets[index + 1]
+        groups[fingerprint.tobytes()] = (mistakes[start:end], wins[start:end])
+    return groups
+
+
+def save_cache(cache_path, groups):
+    """Write group scores, replacing the file atomically."""
+    fingerprints = list(groups)
+    sizes = [len(groups[fingerprint][0]) for fingerprint in fingerprints]
+    temporary = cache_path + ".tmp"
+    with open(temporary, "wb") as handle:
+        np.savez(handle,
+                 fingerprints=np.array([np.frombuffer(fingerprint, dtype=np.uint8) for fingerprint in fingerprints],
+                                       dtype=np.uint8).reshape(len(fingerprints), 16),
+                 offsets=np.concatenate(([0], np.cumsum(sizes, dtype=np.int64))),
+                 mistakes=np.concatenate([groups[fingerprint][0] for fingerprint in fingerprints] or [[]]),
+                 wins=np.concatenate([groups[fingerprint][1] for fingerprint in fingerprints] or [[]]))
+    os.replace(temporary, cache_path)
+
+
+def score_words(word_source, cache_path=None, rounds=DEFAULT_ROUNDS, max_mistakes=MAX_MISTAKES,
+                processes=None, seed=0):
+    """Score every word of a word source, reusing cached groups.
+
+    Args:
+        word_source: WordSource to score
+        cache_path: Cache file, defaults to next to the dictionary file
+        rounds: Games per word, each with different tie breaks
+        max_mistakes: Misses that lose a game
+        processes: Worker processes, defaults to the CPU count (1, inline,
+            below INLINE_WORD_LIMIT words); 1 runs inline
+        seed: Seed for the solver's tie breaks
+
+    Returns:
+        DifficultyIndex for the word source
+    """
+    cache_path = cache_path or default_cache_path(word_source)
+    cached = load_cache(cache_path) if cache_path else {}
+    query = PatternQuery(word_source)
+
+    expected_mistakes = np.zeros(len(word_source), dtype=np.float32)
+    win_probability = np.zeros(len(word_source), dtype=np.float32)
+    groups = {}
+    pending = {}
+    for length in np.unique(np.asarray(word_source.lengths)):
+        table = query.table(int(length))
+        fingerprint = group_fingerprint(table, rounds, max_mistakes)
+        if fingerprint in cached:
+            groups[fingerprint] = cached[fingerprint]
+            expected_mistakes[table.ids], win_probability[table.ids] = cached[fingerprint]
+        else:
+            pending[table.length] = (table, fingerprint)
+
+    def finish(length, mistakes, wins):
+        table, fingerprint = pending[length]
+        groups[fingerprint] = (mistakes / rounds, wins / rounds)
+        expected_mistakes[table.ids], win_probability[table.ids] = groups[fingerprint]
+        if cache_path:
+            try:
+                save_cache(cache_path, groups)
+            except OSError:
+                pass  # Read-only location, score again next time
+
+    seeds = np.random.SeedSequence(seed).spawn(rounds)
+    tasks = [(length, table.position_masks, table.masks, max_mistakes, round_seed)
+             for length, (table, _) in pending.items() for round_seed in seeds]
+    totals = {length: [np.zeros(len(table), np.float32), np.zeros(len(table), np.float32), 0]
+              for length, (table, _) in pending.items()}
+
+    def collect(length, mistakes, won):
+        total = totals[length]
+        total[0] += mistakes
+        total[1] += won
+        total[2] += 1
+        if total[2] == rounds:
+            finish(length, total[0], total[1])
+
+    if processes is None and len(word_source) < INLINE_WORD_LIMIT:
+        processes = 1
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        for task in tasks:
+            collect(*score_task(*task))
+    elif tasks:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(score_task, *task) for task in tasks]
+            for future in as_completed(futures):
+                collect(*future.result())
+
+    return DifficultyIndex(word_source, expected_mistakes, win_probability, max_mistakes)
+
+
+def main():
+    """Command line entry point for scoring dictionaries."""
+    parser = argparse.ArgumentParser(description="Score Hangman words by difficulty.")
+    parser.add_argument("--words", help="dictionary file with one word per line (default: built-in list)")
+    parser.add_argument("--cache", help="cache file (default: next to the dictionary)")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="games per word")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    word_source = load_word_source(args.words)
+    index = score_words(word_source, args.cache, args.rounds, processes=args.processes)
+    bands = index.bands()
+    for band, name in enumerate(DIFFICULTY_BANDS):
+        members = bands == band
+        print(f"{name}: {int(members.sum())} words, "
+              f"win rate {float(index.win_probability[members].mean()):.2%}, "
+              f"{float(index.expected_mistakes[members].mean()):.2f} mistakes")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,143 @@
 """
 Game Logic Module for Hangman Game
 Contains the core game mechanics and state management.
+
+This module is pure Python with no pygame or NumPy dependency, so headless
+bots, simulations and tests can import it in milliseconds. Translating pygame
+events into game actions lives in input_adapter.py.
 """
 
-import pygame
 import random
 from constants import WORDS, MAX_MISTAKES, MESSAGE_DISPLAY_TIME
 
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Change notifications sent to GameLogic.subscribe() listeners
+LETTER_GUESSED = "letter_guessed"  # Details: letter, correct
+GAME_RESET = "game_reset"
+STATE_CHANGED = "state_changed"  # Details: state ("won" or "lost")
+
+
+def letter_bit(letter):
+    """Get the bit representing a letter in a 26-bit guess mask.
+
+    Args:
+        letter: An uppercase letter A-Z
+
+    Returns:
+        Integer with only the letter's bit set
+    """
+    return 1 << (ord(letter) - 65)
+
+
+def word_mask(word):
+    """Get the mask of all distinct letters that appear in a word.
+
+    Args:
+        word: An uppercase word, or any iterable of uppercase letters
+
+    Returns:
+        Integer with one bit set per distinct letter in the word
+    """
+    mask = 0
+    for char in word:
+        mask |= letter_bit(char)
+    return mask
+
+
 class GameLogic:
     """Handles the core game logic including word selection, letter guessing,
-    win/lose conditions, and game state management."""
+    win/lose conditions, and game state management.
+
+    Guesses are tracked as a 26-bit mask so that every guess, including the
+    win check, costs the same no matter how long the word is. Listeners
+    registered with subscribe() are told about every change, so the UI only
+    recomputes derived state when something actually happened."""
     
-    def __init__(self):
-        """Initialize game logic and start a new game."""
+    def __init__(self, word_source=None, difficulty=None, selector=None):
+        """Initialize game logic and start a new game.
+
+        Args:
+            word_source: WordSource to pick words from, None picks from WORDS
+            difficulty: Optional difficulty band name to pick words from
+            selector: Optional WordSelector over word_source for no-repeat picks
+        """
+        if word_source is None and difficulty is not None:
+            # Filtering needs the indexed (NumPy-backed) source
+            from word_source import ListWordSource
+            word_source = ListWordSource()
+        self.word_source = word_source
+        self.difficulty = difficulty
+        self.selector = selector
+        self.listeners = []
         self.reset_game()
 
+    def subscribe(self, listener):
+        """Register a listener for change notifications.
+
+        Args:
+            listener: Callable taking (event, game_logic, **details), where
+                event is LETTER_GUESSED, GAME_RESET or STATE_CHANGED
+        """
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        """Stop sending change notifications to a listener.
+
+        Args:
+            listener: Callable previously passed to subscribe()
+        """
+        self.listeners.remove(listener)
+
+    def emit(self, event, **details):
+        """Notify every listener of a change.
+
+        Args:
+            event: LETTER_GUESSED, GAME_RESET or STATE_CHANGED
+            **details: Event details passed on to the listeners, e.g.
+                letter and correct for LETTER_GUESSED
+        """
+        for listener in self.listeners:
+            listener(event, self, **details)
+
     def reset_game(self):
         """Reset the game to initial state with a new word."""
-        self.word = random.choice(WORDS)
         self.guessed_letters = set()
+        self.guessed_mask = 0
         self.mistakes = 0
         self.game_state = "playing"  # "playing", "won", or "lost"
         self.message = ""
         self.message_timer = 0
+        if self.selector is not None:
+            self.load_word(self.selector.next_word(difficulty=self.difficulty))
+        elif self.word_source is not None:
+            self.load_word(self.word_source.random_word(difficulty=self.difficulty))
+        else:
+            self.load_word(random.choice(WORDS))
+        self.emit(GAME_RESET)
+
+    def load_word(self, word):
+        """Precompute the lookup tables for a word.
+
+        Builds the required-letter mask, the letter -> positions table and
+        the revealed pattern, taking the letters guessed so far into account.
+
+        Args:
+            word: The uppercase word to play
+        """
+        self.word = word
+        self.required_mask = word_mask(word)
+        self.letter_positions = {}
+        for position, char in enumerate(word):
+            self.letter_positions.setdefault(char, []).append(position)
+
+        # Revealed pattern, one "_ " or "X " cell per character
+        self.revealed = ["_ "] * len(word)
+        for char, positions in self.letter_positions.items():
+            if self.guessed_mask & letter_bit(char):
+                for position in positions:
+                    self.revealed[position] = char + " "
+        self.display_cache = None
 
     def guess_letter(self, letter):
         """Process a letter guess and update game state accordingly.
@@ -30,31 +145,67 @@ class GameLogic:
         Args:
             letter: The letter being guessed (uppercase)
         """
+        bit = letter_bit(letter)
+
         # Ignore if letter already guessed or game is over
-        if letter in self.guessed_letters or self.game_state != "playing":
+        if self.guessed_mask & bit or self.game_state != "playing":
             return
 
+        self.guessed_mask |= bit
         self.guessed_letters.add(letter)
 
-        if letter not in self.word:
+        if not self.required_mask & bit:
             # Wrong guess
             self.mistakes += 1
             self.message = f"'{letter}' is not in the word"
             self.message_timer = MESSAGE_DISPLAY_TIME
 
+            self.emit(LETTER_GUESSED, letter=letter, correct=False)
+
             # Check if game is lost
             if self.mistakes >= MAX_MISTAKES:
                 self.game_state = "lost"
                 self.message = "You lost! The word was: " + self.word
-        else:
-            # Correct guess
-            self.message = f"Good! '{letter}' is in the word!"
-            self.message_timer = MESSAGE_DISPLAY_TIME
-            
-        # Check if player has won (after every guess)
-        if all(char in self.guessed_letters for char in self.word):
+                self.display_cache = None
+                self.emit(STATE_CHANGED, state="lost")
+            return
+
+        # Correct guess - reveal the letter in place
+        for position in self.letter_positions[letter]:
+            self.revealed[position] = letter + " "
+        self.display_cache = None
+        self.message = f"Good! '{letter}' is in the word!"
+        self.message_timer = MESSAGE_DISPLAY_TIME
+        self.emit(LETTER_GUESSED, letter=letter, correct=True)
+
+        # Check if player has won
+        if self.guessed_mask & self.required_mask == self.required_mask:
             self.game_state = "won"
             self.message = "Congratulations! You won!"
+            self.emit(STATE_CHANGED, state="won")
+
+    def update(self, ticks=1):
+        """Advance timed state by a number of fixed game ticks.
+
+        Called from the game clock rather than the renderer, so timers run at
+        the same speed at any frame rate, or with no rendering at all.
+
+        Args:
+            ticks: Game ticks (1 / TICK_RATE seconds each) since the last update
+        """
+        if self.message_timer > 0:
+            self.message_timer = max(0, self.message_timer - ticks)
+
+    def show_hint(self, letter):
+        """Show a suggested next letter to the player.
+
+        Args:
+            letter: The suggested letter (uppercase)
+        """
+        if self.game_state != "playing":
+            return
+        self.message = f"Hint: try '{letter}'"
+        self.message_timer = MESSAGE_DISPLAY_TIME
 
     def get_display_word(self):
         """Get the word display string with underscores for unguessed letters.
@@ -62,13 +213,13 @@ class GameLogic:
         Returns:
             String representation of the word with underscores and spaces
         """
-        display_word = ""
-        for char in self.word:
-            if char in self.guessed_letters or self.game_state == "lost":
-                display_word += char + " "  # Show letter if guessed or game over
+        # Rebuilt only after the pattern changed, not every frame
+        if self.display_cache is None:
+            if self.game_state == "lost":
+                self.display_cache = "".join(char + " " for char in self.word)
             else:
-                display_word += "_ "        # Show underscore if not guessed
-        return display_word
+                self.display_cache = "".join(self.revealed)
+        return self.display_cache
 
     def is_game_over(self):
         """Check if the game is in a terminal state.
@@ -77,42 +228,3 @@ class GameLogic:
             True if game is won or lost, False otherwise
         """
         return self.game_state in ["won", "lost"]
-
-
-class InputHandler:
-    """Handles all input events including keyboard and mouse input.
-    Processes user interactions and returns appropriate actions."""
-    
-    @staticmethod
-    def handle_events(event, game_logic, button_manager):
-        """Process a single event and return the appropriate action.
-        
-        Args:
-            event: Pygame event to process
-            game_logic: GameLogic instance
-            button_manager: ButtonManager instance
-            
-        Returns:
-            String indicating the action: "quit", "reset", or "continue"
-        """
-        if event.type == pygame.QUIT:
-            return "quit"
-        
-        if event.type == pygame.KEYDOWN:
-            # Handle keyboard input
-            if event.key == pygame.K_SPACE and game_logic.is_game_over():
-                return "reset"  # Restart game if won/lost
-            elif event.key == pygame.K_ESCAPE:
-                return "quit"   # Exit game
-            elif event.unicode.isalpha() and game_logic.game_state == "playing":
-                # Handle letter input
-                letter = event.unicode.upper()
-                if letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                    game_logic.guess_letter(letter)
-        
-        # Handle button clicks
-        button_letter = button_manager.handle_events(event)
-        if button_letter:
-            game_logic.guess_letter(button_letter)
-        
-        return "continue" 
\ No newline at end of file
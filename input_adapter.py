@@ -0,0 +1,55 @@
+"""
+Input Adapter Module for Hangman Game
+Translates pygame events into actions on the pure-Python game logic.
+"""
+
+import pygame
+from constants import HINT_LABEL
+from game_logic import ALPHABET
+
+# Shows or hides the frame profiler overlay
+PROFILER_KEY = pygame.K_F3
+
+
+class InputHandler:
+    """Handles all input events including keyboard and mouse input.
+    Processes user interactions and returns appropriate actions."""
+    
+    @staticmethod
+    def handle_events(event, game_logic, button_manager):
+        """Process a single event and return the appropriate action.
+        
+        Args:
+            event: Pygame event to process
+            game_logic: GameLogic instance
+            button_manager: ButtonManager instance
+            
+        Returns:
+            String indicating the action: "quit", "reset", "hint", "profiler",
+            or "continue"
+        """
+        if event.type == pygame.QUIT:
+            return "quit"
+        
+        if event.type == pygame.KEYDOWN:
+            # Handle keyboard input
+            if event.key == pygame.K_SPACE and game_logic.is_game_over():
+                return "reset"  # Restart game if won/lost
+            elif event.key == pygame.K_ESCAPE:
+                return "quit"   # Exit game
+            elif event.key == PROFILER_KEY:
+                return "profiler"
+            elif event.unicode.isalpha() and game_logic.game_state == "playing":
+                # Handle letter input
+                letter = event.unicode.upper()
+                if letter in ALPHABET:
+                    game_logic.guess_letter(letter)
+        
+        # Handle button clicks
+        button_letter = button_manager.handle_events(event)
+        if button_letter == HINT_LABEL:
+            return "hint" if game_logic.game_state == "playing" else "continue"
+        if button_letter:
+            game_logic.guess_letter(button_letter)
+        
+        return "continue" 
\ No newline at end of file
@@ -3,71 +3,269 @@ Main Game Module for Hangman Game
 Coordinates all components and runs the main game loop.
 """
 
+import argparse
+import os
 import pygame
 import sys
-from constants import BACKGROUND
-from ui_components import FontManager, ButtonManager, BackgroundRenderer, GameRenderer
-from game_logic import GameLogic, InputHandler
+from constants import BACKGROUND, STAR_COUNT, TARGET_FPS, IDLE_FPS
+from ui_components import FontManager, ButtonManager, BackgroundRenderer, GameRenderer, DirtyRectRenderer
+from game_logic import GameLogic
+from input_adapter import InputHandler
+from adversarial import AdversarialGameLogic
+from word_source import DIFFICULTY_BANDS, load_word_source
+from pattern_query import PatternQuery
+from solver import HintService
+from decision_tree import DecisionTree
+from difficulty import score_words
+from word_selection import WordSelector
+from timing import FramePacer, GameClock
+from profiler import FrameProfiler, NullProfiler
 
 class Game:
     """Main game class that coordinates all components"""
     
-    def __init__(self):
-        """Initialize the game with all components."""
+    def __init__(self, word_source=None, evil=False, tree=None, difficulty=None, selector=None,
+                 dirty_rects=False, star_count=STAR_COUNT, fps=TARGET_FPS, idle_fps=IDLE_FPS,
+                 adaptive_fps=False, profile=False, profile_path=None, headless_size=None):
+        """Initialize the game with all components.
+
+        Args:
+            word_source: WordSource to pick words from, defaults to WORDS
+            evil: Play the adversarial mode that never commits to a word
+            tree: Optional DecisionTree answering hints by lookup
+            difficulty: Optional difficulty band name to pick words from
+            selector: Optional WordSelector for no-repeat or daily words
+            dirty_rects: Only redraw and present the screen areas that changed
+            star_count: Number of stars in the animated background
+            fps: Frame rate while the game is in use
+            idle_fps: Frame rate while idle with adaptive_fps, 0 to only wake on input
+            adaptive_fps: Drop to idle_fps when there is no input
+            profile: Time every stage of each frame; F3 shows the timings
+            profile_path: Optional JSON file the stage timings are written to
+                at exit, implies profile
+            headless_size: (width, height) to render offscreen with no window,
+                frame by frame through step(); dirty_rects is ignored
+        """
+        self.headless = headless_size is not None
+        if self.headless:
+            # No window at all, even where a display is available
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
         # Initialize Pygame
         pygame.init()
-        
-        # Create fullscreen window and get dimensions
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+
+        if self.headless:
+            self.screen = pygame.Surface(headless_size)
+        else:
+            # Create fullscreen window
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            pygame.display.set_caption('Hangman Game')
         self.width, self.height = self.screen.get_size()
-        pygame.display.set_caption('Hangman Game')
         
         # Initialize game components
-        self.clock = pygame.time.Clock()
+        self.pacer = FramePacer(fps, idle_fps, adaptive=adaptive_fps)
+        self.game_clock = GameClock()
+        self.profiler = FrameProfiler() if profile or profile_path else NullProfiler()
+        self.profile_path = profile_path
         self.fonts = FontManager()
-        self.game_logic = GameLogic()
+        logic_class = AdversarialGameLogic if evil else GameLogic
+        self.game_logic = logic_class(word_source, difficulty, selector)
         self.button_manager = ButtonManager(self.fonts, self.width, self.height)
         self.game_renderer = GameRenderer(self.fonts)
+        self.game_renderer.profiler = self.profiler
+        self.background = BackgroundRenderer(self.width, self.height, star_count)
         self.input_handler = InputHandler()
+        # Evil mode already holds length tables for the dictionary; share them
+        query = getattr(self.game_logic, "query", None) or PatternQuery(self.game_logic.word_source)
+        self.hint_service = HintService(query, tree)
+        self.hint_service.update(self.game_logic)
+
+        # Derived state is only updated when the game reports a change
+        self.button_manager.watch(self.game_logic)
+        self.game_renderer.watch(self.game_logic)
+        self.game_logic.subscribe(self.on_game_event)
+        self.dirty_renderer = None
+        if dirty_rects and not self.headless:
+            self.dirty_renderer = DirtyRectRenderer(self.game_renderer, self.background, self.width, self.height)
+
+    def on_game_event(self, event, game_logic, **details):
+        """Let the hint solver narrow its candidates after every change."""
+        self.hint_service.update(game_logic)
 
     def reset_game(self):
         """Reset the game to start a new round."""
         self.game_logic.reset_game()
-        self.button_manager.reset_buttons()
+
+    def handle_events(self, events):
+        """Apply a frame's input events to the game.
+
+        Returns:
+            False if one of them asked to quit, True otherwise
+        """
+        running = True
+        self.pacer.note_events(events)
+        for event in events:
+            result = self.input_handler.handle_events(event, self.game_logic, self.button_manager)
+
+            if result == "quit":
+                running = False
+            elif result == "reset":
+                self.reset_game()
+            elif result == "hint":
+                self.hint_service.request_hint(self.game_logic)
+            elif result == "profiler":
+                self.profiler.toggle_overlay()
+                if self.dirty_renderer:
+                    self.dirty_renderer.invalidate()  # Uncover the screen under a hidden overlay
+
+        # Show hints the background solver has finished
+        hint = self.hint_service.poll(self.game_logic)
+        if hint:
+            self.game_logic.show_hint(hint)
+        return running
+
+    def draw_frame(self):
+        """Draw the whole frame onto self.screen without presenting it."""
+        profiler = self.profiler
+
+        # Clear screen and draw background
+        with profiler.stage("fill"):
+            self.screen.fill(BACKGROUND)
+        with profiler.stage("background"):
+            self.background.draw_decorations(self.screen, self.game_clock.time)
+
+        # Draw all game elements
+        with profiler.stage("draw"):
+            self.game_renderer.draw(self.screen, self.game_logic, self.button_manager, self.width, self.height)
+        return profiler.draw_overlay(self.screen)
+
+    def step(self, events=(), ticks=1, view="3"):
+        """Advance one frame offscreen and get its pixels.
+
+        Game time moves by exactly `ticks`, so the same events give the same
+        frames on any machine.
+
+        Args:
+            events: pygame events to handle this frame
+            ticks: Game ticks to advance
+            view: Surface.get_view() kind: "3" for a (width, height, 3) RGB
+                view, "2" for packed pixels, "0" for the raw bytes
+
+        Returns:
+            Zero-copy BufferProxy over the frame, e.g. for numpy.asarray()
+            or memoryview(); arrays taken from it lock the surface, so drop
+            them (or copy the pixels) before the next step
+
+        Raises:
+            RuntimeError: If the previous frame's pixels are still locked
+        """
+        if self.screen.get_locked():
+            raise RuntimeError("Drop the arrays over the previous frame before calling step() again")
+        self.profiler.begin_frame()
+        with self.profiler.stage("update"):
+            self.game_logic.update(self.game_clock.step(ticks))
+        with self.profiler.stage("events"):
+            self.handle_events(list(events))
+        self.draw_frame()
+        self.profiler.end_frame()
+        return self.screen.get_view(view)
 
     def run(self):
         """Main game loop."""
         running = True
+        profiler = self.profiler
+        woken_by = None  # Event that ended the last idle wait
         while running:
-            # Clear screen and draw background
-            self.screen.fill(BACKGROUND)
-            BackgroundRenderer.draw_decorations(self.screen, self.width, self.height)
+            profiler.begin_frame()
+
+            # Advance timers by the fixed ticks that elapsed, whatever the frame rate
+            with profiler.stage("update"):
+                self.game_logic.update(self.game_clock.advance(self.pacer.waited))
 
             # Handle events
-            for event in pygame.event.get():
-                result = self.input_handler.handle_events(event, self.game_logic, self.button_manager)
-                
-                if result == "quit":
-                    running = False
-                elif result == "reset":
-                    self.reset_game()
-
-            # Draw all game elements
-            self.game_renderer.draw(self.screen, self.game_logic, self.button_manager, self.width, self.height)
-            
-            # Update display
-            pygame.display.flip()
-            self.clock.tick(60)
+            with profiler.stage("events"):
+                events = pygame.event.get()
+                if woken_by is not None:
+                    events.insert(0, woken_by)
+                running = self.handle_events(events)
 
-        # Clean up
-        pygame.quit()
+            if self.dirty_renderer:
+                # Redraw and present only what changed
+                with profiler.stage("render"):
+                    self.dirty_renderer.render(self.screen, self.game_logic, self.button_manager,
+                                               self.game_clock.time)
+                overlay = profiler.draw_overlay(self.screen)
+                if overlay:
+                    pygame.display.update(overlay)
+            else:
+                self.draw_frame()
+
+                # Update display
+                with profiler.stage("flip"):
+                    pygame.display.flip()
+
+            # Stay at full rate while a message is counting down
+            with profiler.stage("wait"):
+                woken_by = self.pacer.wait(busy=self.game_logic.message_timer > 0)
+            profiler.end_frame()
+
+        self.close()
         sys.exit()
 
+    def close(self):
+        """Stop the background work and shut pygame down."""
+        if self.profile_path:
+            self.profiler.write_report(self.profile_path)
+        self.hint_service.stop()
+        pygame.quit()
+
 
 def main():
     """Entry point for the game."""
-    game = Game()
-    game.run()
+    parser = argparse.ArgumentParser(description="Play Hangman.")
+    parser.add_argument("--words", help="dictionary file with one word per line (default: built-in list)")
+    parser.add_argument("--evil", action="store_true", help="adversarial mode: the word changes to dodge your guesses")
+    parser.add_argument("--tree", help="decision tree file built by decision_tree.py for instant hints")
+    parser.add_argument("--difficulty", choices=DIFFICULTY_BANDS,
+                        help="only play words of this difficulty (scored at startup; scores for "
+                             "--words files are cached next to the file)")
+    parser.add_argument("--daily", action="store_true", help="play the word of the day")
+    parser.add_argument("--history", help="file remembering played words across runs so they don't repeat")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only redraw the parts of the screen that change (faster on large screens)")
+    parser.add_argument("--fps", type=int, default=TARGET_FPS, help="frame rate while playing")
+    parser.add_argument("--adaptive-fps", action="store_true",
+                        help="slow down to --idle-fps when there is no input (saves CPU on always-on machines)")
+    parser.add_argument("--idle-fps", type=int, default=IDLE_FPS,
+                        help="frame rate while idle with --adaptive-fps; 0 only redraws on input")
+    parser.add_argument("--profile", action="store_true",
+                        help="time every stage of each frame; press F3 to show the timings")
+    parser.add_argument("--profile-json", help="write the frame stage timings to this JSON file at exit")
+    parser.add_argument("--headless", metavar="WIDTHxHEIGHT",
+                        help="render offscreen at this size without a window, e.g. 640x360")
+    parser.add_argument("--frames", type=int, default=1, help="frames to render with --headless")
+    parser.add_argument("--snapshot", default="hangman.png", help="image file of the last --headless frame")
+    parser.add_argument("--stars", type=int, default=STAR_COUNT, help="number of background stars (up to about 10000)")
+    args = parser.parse_args()
+
+    word_source = load_word_source(args.words)
+    if args.difficulty:
+        score_words(word_source).apply()
+    selector = WordSelector(word_source, state_path=args.history, daily=args.daily)
+    tree = DecisionTree(args.tree, word_source) if args.tree else None
+    headless_size = tuple(int(side) for side in args.headless.lower().split("x")) if args.headless else None
+    game = Game(word_source, evil=args.evil, tree=tree, difficulty=args.difficulty, selector=selector,
+                dirty_rects=args.dirty_rects, star_count=args.stars, fps=args.fps, idle_fps=args.idle_fps,
+                adaptive_fps=args.adaptive_fps, profile=args.profile, profile_path=args.profile_json,
+                headless_size=headless_size)
+    if not game.headless:
+        game.run()
+
+    # Render the frames offscreen and keep the last one
+    for _ in range(args.frames):
+        game.step()
+    pygame.image.save(game.screen, args.snapshot)
+    game.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,206 @@
+"""
+Pattern Query Module for Hangman Game
+Finds every dictionary word that fits a revealed pattern.
+
+Words are grouped by length into tables holding a words x positions byte
+matrix and per-word letter masks, built once per length on first use. A query
+is then a single vectorized pass over the table of the pattern's length,
+which is what hint, solver and cheat-detection tooling run in their loops.
+"""
+
+import numpy as np
+
+from game_logic import ALPHABET, word_mask
+from word_source import ListWordSource
+
+LETTER_INDICES = np.arange(26, dtype=np.uint32)
+
+
+def parse_pattern(pattern):
+    """Split a revealed pattern into cells.
+
+    Accepts the spaced form produced by GameLogic.get_display_word
+    ("_ A _ _ _ ") as well as the compact form ("_A___").
+
+    Args:
+        pattern: Pattern string, "_" marks an unrevealed letter
+
+    Returns:
+        List with an uppercase letter or None per position
+    """
+    cells = pattern.split() if " " in pattern.strip() else list(pattern.strip())
+    return [None if cell == "_" else cell.upper() for cell in cells]
+
+
+def letter_counts(masks):
+    """Count how many words contain each letter.
+
+    Args:
+        masks: uint32 array of per-word letter masks
+
+    Returns:
+        int64 array of 26 counts, index 0 = A
+    """
+    return ((masks[:, None] >> LETTER_INDICES) & 1).sum(axis=0, dtype=np.int64)
+
+
+def largest_family(keys, length):
+    """Find the most common family key.
+
+    Ties go to the smallest key, so a miss (key 0) wins any tie.
+
+    Args:
+        keys: uint32 array of family keys, see LengthTable.position_masks
+        length: Word length, the keys have at most this many bits
+
+    Returns:
+        Tuple of (family key, family size)
+    """
+    if length <= 16:
+        counts = np.bincount(keys)
+        best = int(counts.argmax())
+        return best, int(counts[best])
+    families, counts = np.unique(keys, return_counts=True)
+    best = int(counts.argmax())
+    return int(families[best]), int(counts[best])
+
+
+class LengthTable:
+    """Precomputed arrays for all dictionary words of one length."""
+
+    def __init__(self, word_source, length):
+        self.length = length
+        self.ids = word_source.ids_with_length(length)
+        self.letters = word_source.letter_matrix(self.ids, length)
+        self.masks = np.asarray(word_source.masks)[self.ids]
+        self.position_mask_array = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def position_masks(self):
+        """uint32 array of shape (26, words) with the positions of each letter.
+
+        Bit p of position_masks[letter, row] is set when the word has that
+        letter at position p. Words that share a key for a letter fall into
+        the same family when that letter is guessed. Built on first use.
+        """
+        if self.position_mask_array is None:
+            position_masks = np.zeros((26, len(self.ids)), dtype=np.uint32)
+            rows = np.arange(len(self.ids))
+            for position in range(self.length):
+                position_masks[self.letters[:, position], rows] |= np.uint32(1 << position)
+            self.position_mask_array = position_masks
+        return self.position_mask_array
+
+    def filter(self, rows, cells, excluded_mask):
+        """Keep the rows whose words fit the pattern cells.
+
+        A word fits when it has the revealed letters at the revealed
+        positions, none of the excluded letters, and none of the revealed
+        letters at a hidden position (a guessed letter is always revealed
+        everywhere it occurs).
+
+        Args:
+            rows: Array of row indices into this table, or None for all rows
+            cells: Parsed pattern, see parse_pattern()
+            excluded_mask: Mask of letters known not to be in the word
+
+        Returns:
+            Array of the matching row indices
+        """
+        revealed = [(position, ord(cell) - 65) for position, cell in enumerate(cells) if cell]
+        hidden = [position for position, cell in enumerate(cells) if not cell]
+
+        if rows is None:
+            rows = np.arange(len(self.ids))
+            letters, masks = self.letters, self.masks
+        else:
+            letters, masks = self.letters[rows], self.masks[rows]
+
+        matches = (masks & np.uint32(excluded_mask)) == 0
+        if revealed:
+            positions, codes = zip(*revealed)
+            matches &= (letters[:, positions] == np.array(codes, dtype=np.uint8)).all(axis=1)
+            if hidden:
+                forbidden = np.zeros(26, dtype=bool)
+                forbidden[list(codes)] = True
+                matches &= ~forbidden[letters[:, hidden]].any(axis=1)
+        return np.compress(matches, rows)
+
+
+class QueryResult:
+    """Words matching a pattern query and their letter frequencies."""
+
+    def __init__(self, word_source, table, rows):
+        self.word_source = word_source
+        self.ids = table.ids[rows]
+        self.masks = table.masks[rows]
+        self.letter_counts = letter_counts(self.masks)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def words(self, limit=None):
+        """Decode the matching words.
+
+        Args:
+            limit: Optional maximum number of words to decode
+
+        Returns:
+            List of uppercase words
+        """
+        ids = self.ids if limit is None else self.ids[:limit]
+        return [self.word_source.word(int(index)) for index in ids]
+
+    def frequencies(self):
+        """Get the letter counts as a dict, most common letters first."""
+        order = np.argsort(-self.letter_counts, kind="stable")
+        return {ALPHABET[index]: int(self.letter_counts[index]) for index in order if self.letter_counts[index]}
+
+
+class PatternQuery:
+    """Answers "which words fit this pattern" queries against a word source."""
+
+    def __init__(self, word_source=None):
+        """Initialize the query API.
+
+        Args:
+            word_source: WordSource to search, defaults to WORDS
+        """
+        self.word_source = word_source if word_source is not None else ListWordSource()
+        self.tables = {}
+
+    def table(self, length):
+        """Get the LengthTable for a word length, building it on first use."""
+        if length not in self.tables:
+            self.tables[length] = LengthTable(self.word_source, length)
+        return self.tables[length]
+
+    def match(self, pattern, excluded=()):
+        """Find every word that fits a revealed pattern.
+
+        Args:
+            pattern: Revealed pattern such as "_ A _ _ _ "
+            excluded: Letters known not to be in the word
+
+        Returns:
+            QueryResult with the matching words and their letter counts
+        """
+        cells = parse_pattern(pattern)
+        table = self.table(len(cells))
+        rows = table.filter(None, cells, word_mask(letter.upper() for letter in excluded))
+        return QueryResult(self.word_source, table, rows)
+
+    def match_game(self, game_logic):
+        """Find every word that fits the current state of a game.
+
+        Args:
+            game_logic: GameLogic instance
+
+        Returns:
+            QueryResult for the game's revealed pattern and wrong guesses
+        """
+        wrong = game_logic.guessed_letters - set(game_logic.word)
+        return self.match("".join(game_logic.revealed), wrong)
@@ -0,0 +1,171 @@
+"""
+Profiler Module for Hangman Game
+Times each stage of a frame and keeps rolling percentiles.
+
+The main loop and the renderers wrap their stages in `profiler.stage(name)`.
+When profiling is off they get a NullProfiler, whose stages are shared
+no-op context managers, so the instrumentation costs next to nothing.
+"""
+
+import contextlib
+import json
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+
+from constants import PROFILE_WINDOW
+
+PERCENTILES = (50, 95, 99)
+
+# Frames between refreshes of the overlay text
+OVERLAY_REFRESH_FRAMES = 15
+
+
+class StageTimer:
+    """Context manager adding its duration in milliseconds to a sample window."""
+
+    __slots__ = ("samples", "start")
+
+    def __init__(self, samples):
+        self.samples = samples
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.samples.append((time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class NullProfiler:
+    """Stands in for FrameProfiler when profiling is off."""
+
+    overlay_visible = False
+    timer = contextlib.nullcontext()
+
+    def stage(self, name):
+        return self.timer
+
+    def begin_frame(self):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def toggle_overlay(self):
+        pass
+
+    def draw_overlay(self, surface):
+        return None
+
+
+class FrameProfiler:
+    """Rolling per-stage frame timings with an on-screen overlay.
+
+    Stage names are dotted, e.g. "draw.hangman" is part of "draw". Each
+    stage keeps its last `window` samples, and "frame" is the time from one
+    begin_frame() to the next, including the wait for the next frame."""
+
+    def __init__(self, window=PROFILE_WINDOW):
+        self.window = window
+        self.samples = {}
+        self.timers = {}
+        self.frames = 0
+        self.frame_start = None
+        self.overlay_visible = False
+        self.overlay_surface = None
+        self.overlay_font = None
+
+    def stage(self, name):
+        """Get the timer for a stage, to be used as `with profiler.stage(name):`."""
+        timer = self.timers.get(name)
+        if timer is None:
+            self.samples[name] = deque(maxlen=self.window)
+            timer = self.timers[name] = StageTimer(self.samples[name])
+        return timer
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        if self.frame_start is not None:
+            self.stage("frame").samples.append((now - self.frame_start) * 1000)
+        self.frame_start = now
+        self.frames += 1
+
+    def end_frame(self):
+        """Finish a frame; refreshes the overlay text every few frames."""
+        if self.overlay_visible and self.frames % OVERLAY_REFRESH_FRAMES == 0:
+            self.overlay_surface = None
+
+    def percentiles(self, name):
+        """Get the rolling timings of a stage.
+
+        Returns:
+            Dict with "p50", "p95", "p99", "mean" and "max" in milliseconds
+            and the number of samples, or None if there are no samples
+        """
+        samples = self.samples.get(name)
+        if not samples:
+            return None
+        values = np.fromiter(samples, dtype=np.float64, count=len(samples))
+        result = {f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+        result["mean"] = float(values.mean())
+        result["max"] = float(values.max())
+        result["samples"] = len(values)
+        return result
+
+    def report(self):
+        """Get every stage's rolling timings, in the order stages first ran."""
+        return {
+            "frames": self.frames,
+            "window": self.window,
+            "stages": {name: self.percentiles(name) for name in self.samples if self.samples[name]},
+        }
+
+    def write_report(self, path):
+        with open(path, "w") as handle:
+            json.dump(self.report(), handle, indent=2)
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self.overlay_surface = None
+
+    def draw_overlay(self, surface):
+        """Draw the stage timings in the top-left corner when the overlay is on.
+
+        Returns:
+            Rect that was drawn, or None if the overlay is off
+        """
+        if not self.overlay_visible:
+            return None
+        if self.overlay_surface is None:
+            self.overlay_surface = self.render_overlay()
+        return surface.blit(self.overlay_surface, (20, 20))
+
+    def render_overlay(self):
+        if self.overlay_font is None:
+            self.overlay_font = pygame.font.SysFont("consolas", 16)
+        font = self.overlay_font
+        rows = [("stage",) + tuple(f"p{p}" for p in PERCENTILES)]
+        for name in self.samples:
+            timings = self.percentiles(name)
+            if timings:
+                rows.append((name,) + tuple(f"{timings[f'p{p}']:.2f}" for p in PERCENTILES))
+
+        # Stage names left-aligned, timings right-aligned in fixed columns
+        name_width = max(font.size(row[0])[0] for row in rows) + 16
+        # At least as wide as "9999.99" so the panel keeps its size as timings change
+        column_width = max(font.size(cell)[0] for row in rows for cell in row[1:] + ("9999.99",)) + 16
+        line_height = font.get_linesize()
+        overlay = pygame.Surface((name_width + column_width * len(PERCENTILES) + 16, line_height * len(rows) + 16))
+        overlay.fill((0, 0, 0))
+        for index, row in enumerate(rows):
+            y = 8 + index * line_height
+            overlay.blit(font.render(row[0], True, (240, 240, 250)), (8, y))
+            for column, cell in enumerate(row[1:], 1):
+                text = font.render(cell, True, (240, 240, 250))
+                overlay.blit(text, (8 + name_width + column * column_width - text.get_width(), y))
+        return overlay
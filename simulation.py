@@ -0,0 +1,278 @@
+"""
+Headless Simulation Module for Hangman Game
+Plays large batches of games without a display for load and balance testing.
+
+Games are played in lockstep: every game in a batch is a row in a set of
+NumPy arrays (word id, guess mask, mistakes), so a million games cost a few
+dozen vectorized steps instead of a million GameLogic objects. The rules are
+the same as GameLogic's: a guess is a bit in a 26-bit mask, a game is won when
+every letter of the word is guessed and lost after MAX_MISTAKES misses.
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from constants import WORDS, MAX_MISTAKES
+from game_logic import ALPHABET, word_mask
+
+LETTER_INDICES = np.arange(26, dtype=np.uint32)
+
+
+class GameBatch:
+    """State of a batch of games that are still being played.
+
+    Strategies only read the fields a real player could know: the guess mask,
+    which guessed letters were hits, the mistakes and the word length."""
+
+    def __init__(self, word_ids, required, lengths):
+        self.word_ids = word_ids
+        self.required = required
+        self.lengths = lengths
+        self.guessed = np.zeros(len(word_ids), dtype=np.uint32)
+        self.mistakes = np.zeros(len(word_ids), dtype=np.uint8)
+
+    def __len__(self):
+        return len(self.word_ids)
+
+    @property
+    def hits(self):
+        """Mask of guessed letters that are in each game's word."""
+        return self.guessed & self.required
+
+    def keep(self, selection):
+        """Drop finished games, keeping only the selected rows."""
+        self.word_ids = self.word_ids[selection]
+        self.required = self.required[selection]
+        self.lengths = self.lengths[selection]
+        self.guessed = self.guessed[selection]
+        self.mistakes = self.mistakes[selection]
+
+
+class GuessStrategy:
+    """Base class for guessing strategies used by the simulator.
+
+    Subclasses must be picklable so they can be sent to worker processes."""
+
+    def prepare(self, words):
+        """Called once per worker before any game is played.
+
+        Args:
+            words: List of uppercase words games are drawn from
+        """
+
+    def choose(self, batch, rng):
+        """Pick the next letter for every game in the batch.
+
+        Args:
+            batch: GameBatch of the games still being played
+            rng: NumPy random Generator
+
+        Returns:
+            Integer array with one letter index (0 = A) per game; the letter
+            must not have been guessed yet in that game
+        """
+        raise NotImplementedError
+
+
+class RandomStrategy(GuessStrategy):
+    """Guesses a uniformly random letter that hasn't been tried yet."""
+
+    def choose(self, batch, rng):
+        keys = rng.random((len(batch), 26))
+        guessed = (batch.guessed[:, None] >> LETTER_INDICES) & 1
+        keys[guessed.astype(bool)] = -1.0
+        return keys.argmax(axis=1)
+
+
+class FrequencyStrategy(GuessStrategy):
+    """Guesses letters in a fixed order, most common letters first.
+
+    The order defaults to how many dictionary words contain each letter."""
+
+    def __init__(self, order=None):
+        self.order = order
+
+    def prepare(self, words):
+        if self.order is None:
+            counts = {letter: 0 for letter in ALPHABET}
+            for word in words:
+                for letter in set(word):
+                    counts[letter] += 1
+            self.order = "".join(sorted(ALPHABET, key=lambda letter: -counts[letter]))
+        self.order_indices = np.array([ord(letter) - 65 for letter in self.order], dtype=np.uint32)
+
+    def choose(self, batch, rng):
+        untried = ((batch.guessed[:, None] >> self.order_indices) & 1) == 0
+        return self.order_indices[untried.argmax(axis=1)]
+
+
+STRATEGIES = {
+    "random": RandomStrategy,
+    "frequency": FrequencyStrategy,
+}
+
+
+class SimulationReport:
+    """Aggregated results of a simulation run."""
+
+    def __init__(self, words, max_mistakes):
+        self.words = list(words)
+        self.max_mistakes = max_mistakes
+        self.games = 0
+        self.wins = 0
+        self.mistake_histogram = np.zeros(max_mistakes + 1, dtype=np.int64)
+        self.word_games = np.zeros(len(self.words), dtype=np.int64)
+        self.word_wins = np.zeros(len(self.words), dtype=np.int64)
+        self.word_mistakes = np.zeros(len(self.words), dtype=np.int64)
+
+    def merge(self, other):
+        """Add the counts of another report over the same words."""
+        self.games += other.games
+        self.wins += other.wins
+        self.mistake_histogram += other.mistake_histogram
+        self.word_games += other.word_games
+        self.word_wins += other.word_wins
+        self.word_mistakes += other.word_mistakes
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games if self.games else 0.0
+
+    def word_difficulty(self):
+        """Get per-word results, hardest words first.
+
+        Returns:
+            List of (word, games, win rate, mean mistakes) tuples for every
+            word that was played at least once
+        """
+        played = np.flatnonzero(self.word_games)
+        games = self.word_games[played]
+        win_rates = self.word_wins[played] / games
+        mean_mistakes = self.word_mistakes[played] / games
+        order = np.lexsort((-mean_mistakes, win_rates))
+        return [(self.words[played[i]], int(games[i]), float(win_rates[i]), float(mean_mistakes[i]))
+                for i in order]
+
+    def summary(self, top=10):
+        """Get a human-readable summary of the run."""
+        lines = [f"Games: {self.games}", f"Win rate: {self.win_rate:.2%}", "Mistakes:"]
+        for mistakes, count in enumerate(self.mistake_histogram):
+            share = count / self.games if self.games else 0.0
+            lines.append(f"  {mistakes}: {count} ({share:.2%})")
+        lines.append("Hardest words:")
+        for word, games, win_rate, mean_mistakes in self.word_difficulty()[:top]:
+            lines.append(f"  {word}: win rate {win_rate:.2%}, {mean_mistakes:.2f} mistakes over {games} games")
+        return "\n".join(lines)
+
+
+def play_batch(batch, strategy, rng, max_mistakes, report):
+    """Play every game in a batch to the end and record the results.
+
+    Args:
+        batch: GameBatch of fresh games
+        strategy: GuessStrategy choosing the letters
+        rng: NumPy random Generator passed to the strategy
+        max_mistakes: Number of misses that loses a game
+        report: SimulationReport the results are added to
+    """
+    while len(batch):
+        bits = np.left_shift(np.uint32(1), strategy.choose(batch, rng).astype(np.uint32))
+        batch.guessed |= bits
+        batch.mistakes += (batch.required & bits) == 0
+
+        won = (batch.guessed & batch.required) == batch.required
+        lost = batch.mistakes >= max_mistakes
+        finished = won | lost
+        if finished.any():
+            word_ids = batch.word_ids[finished]
+            mistakes = batch.mistakes[finished]
+            report.games += len(word_ids)
+            report.wins += int(won.sum())
+            report.mistake_histogram += np.bincount(mistakes, minlength=max_mistakes + 1)
+            report.word_games += np.bincount(word_ids, minlength=len(report.words))
+            report.word_wins += np.bincount(batch.word_ids[won], minlength=len(report.words))
+            report.word_mistakes += np.bincount(word_ids, weights=mistakes,
+                                                minlength=len(report.words)).astype(np.int64)
+            batch.keep(~finished)
+
+
+def simulate_chunk(words, n_games, strategy, seed, batch_size, max_mistakes):
+    """Play one chunk of games; this is the unit of work of a worker process.
+
+    Returns:
+        SimulationReport for the chunk
+    """
+    rng = np.random.default_rng(seed)
+    strategy.prepare(words)
+    required = np.array([word_mask(word) for word in words], dtype=np.uint32)
+    lengths = np.array([len(word) for word in words], dtype=np.uint8)
+    report = SimulationReport(words, max_mistakes)
+
+    for start in range(0, n_games, batch_size):
+        count = min(batch_size, n_games - start)
+        word_ids = rng.integers(len(words), size=count)
+        batch = GameBatch(word_ids, required[word_ids], lengths[word_ids])
+        play_batch(batch, strategy, rng, max_mistakes, report)
+    return report
+
+
+def simulate(n_games, strategy=None, words=WORDS, processes=None, batch_size=100_000,
+             seed=0, max_mistakes=MAX_MISTAKES):
+    """Play n_games headless games and aggregate the results.
+
+    Games are split into chunks of batch_size that are spread over a process
+    pool. Chunks get their own seeds, so a run is reproducible for a given
+    seed no matter how many processes are used.
+
+    Args:
+        n_games: Total number of games to play
+        strategy: GuessStrategy instance, defaults to FrequencyStrategy
+        words: List of uppercase words to draw from
+        processes: Worker processes, defaults to the CPU count; 1 runs inline
+        batch_size: Games played in lockstep per chunk
+        seed: Seed for word selection and random strategies
+        max_mistakes: Number of misses that loses a game
+
+    Returns:
+        SimulationReport with the aggregated results
+    """
+    strategy = strategy if strategy is not None else FrequencyStrategy()
+    words = list(words)
+    chunk_sizes = [min(batch_size, n_games - start) for start in range(0, n_games, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    processes = processes or os.cpu_count() or 1
+
+    report = SimulationReport(words, max_mistakes)
+    if processes == 1 or len(chunk_sizes) == 1:
+        for size, chunk_seed in zip(chunk_sizes, seeds):
+            report.merge(simulate_chunk(words, size, strategy, chunk_seed, batch_size, max_mistakes))
+        return report
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(simulate_chunk, words, size, strategy, chunk_seed, batch_size, max_mistakes)
+                   for size, chunk_seed in zip(chunk_sizes, seeds)]
+        for future in futures:
+            report.merge(future.result())
+    return report
+
+
+def main():
+    """Command line entry point for running simulations."""
+    parser = argparse.ArgumentParser(description="Play headless Hangman games and report the results.")
+    parser.add_argument("--games", type=int, default=1_000_000, help="number of games to play")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="frequency")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--batch-size", type=int, default=100_000, help="games played in lockstep per chunk")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    report = simulate(args.games, STRATEGIES[args.strategy](), processes=args.processes,
+                      batch_size=args.batch_size, seed=args.seed)
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
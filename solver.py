@@ -0,0 +1,180 @@
+"""
+Solver Module for Hangman Game
+Suggests the best next letter for a game in progress.
+
+The solver keeps the set of dictionary words that are still consistent with
+the game and narrows it after every guess, so each step only filters the
+remaining candidates instead of rescanning the dictionary. HintService runs
+it on a worker thread so the frame loop never waits for it.
+"""
+
+import queue
+import threading
+
+import numpy as np
+
+from game_logic import ALPHABET, letter_bit, word_mask
+from pattern_query import PatternQuery, letter_counts
+
+# Letters by overall English frequency, used when no candidate is left
+FALLBACK_ORDER = "ETAOINSRHLDCUMFPGWYBVKXJQZ"
+
+
+def game_snapshot(game_logic):
+    """Capture the player-visible state of a game.
+
+    Returns:
+        Tuple of (pattern cells, guessed letters mask)
+    """
+    cells = tuple(None if cell[0] == "_" else cell[0] for cell in game_logic.revealed)
+    return cells, game_logic.guessed_mask
+
+
+class CandidateSolver:
+    """Tracks the dictionary words still consistent with a game."""
+
+    def __init__(self, query=None):
+        """Initialize the solver.
+
+        Args:
+            query: PatternQuery over the dictionary, defaults to WORDS
+        """
+        self.query = query if query is not None else PatternQuery()
+        self.reset(0)
+
+    def reset(self, length):
+        """Start over for a new word of the given length."""
+        self.table = self.query.table(length) if length else None
+        self.rows = None  # None means every word of this length
+        self.cells = (None,) * length
+        self.guessed_mask = 0
+
+    def candidate_count(self):
+        if self.table is None:
+            return 0
+        return len(self.table) if self.rows is None else len(self.rows)
+
+    def sync(self, cells, guessed_mask):
+        """Bring the candidate set up to date with a game snapshot.
+
+        Only the letters guessed since the last sync are applied, and only to
+        the remaining candidates. A snapshot that can't follow the previous
+        one (shorter guess set, other length, other revealed letters) is a
+        new game and starts over.
+
+        Args:
+            cells: Pattern cells, an uppercase letter or None per position
+            guessed_mask: Mask of all letters guessed so far
+        """
+        cells = tuple(cells)
+        follows = (len(cells) == len(self.cells)
+                   and guessed_mask & self.guessed_mask == self.guessed_mask
+                   and all(old is None or old == new for old, new in zip(self.cells, cells)))
+        if not follows:
+            self.reset(len(cells))
+        if guessed_mask == self.guessed_mask or self.table is None:
+            return
+
+        revealed_mask = word_mask(cell for cell in cells if cell)
+        new_mask = guessed_mask & ~self.guessed_mask
+        self.rows = self.table.filter(self.rows, cells, new_mask & ~revealed_mask)
+        self.cells = cells
+        self.guessed_mask = guessed_mask
+
+    def best_letter(self):
+        """Get the unguessed letter found in the most remaining candidates.
+
+        Returns:
+            Uppercase letter, or None if every letter has been guessed
+        """
+        if self.candidate_count():
+            masks = self.table.masks if self.rows is None else self.table.masks[self.rows]
+            counts = letter_counts(masks)
+            guessed = (self.guessed_mask >> np.arange(26)) & 1
+            counts[guessed.astype(bool)] = -1
+            best = int(counts.argmax())
+            if counts[best] > 0:
+                return ALPHABET[best]
+
+        for letter in FALLBACK_ORDER:
+            if not self.guessed_mask & letter_bit(letter):
+                return letter
+        return None
+
+
+class HintService:
+    """Runs a CandidateSolver on a background thread.
+
+    The game pushes snapshots after guesses and asks for hints; both calls
+    only enqueue work. Results are picked up with poll() on a later frame.
+    With a precomputed DecisionTree, states found in the tree are answered
+    immediately instead."""
+
+    def __init__(self, query=None, tree=None):
+        self.solver = CandidateSolver(query)
+        self.tree = tree
+        self.requests = queue.Queue()
+        self.lock = threading.Lock()
+        self.last_snapshot = None
+        self.result = None  # (guessed mask, letter) of the latest hint
+        self.thread = threading.Thread(target=self.work, name="hint-solver", daemon=True)
+        self.thread.start()
+
+    def update(self, game_logic):
+        """Let the solver narrow its candidates after a guess or reset."""
+        snapshot = game_snapshot(game_logic)
+        if snapshot != self.last_snapshot:
+            self.last_snapshot = snapshot
+            self.requests.put((snapshot, False))
+
+    def request_hint(self, game_logic):
+        """Ask for the best next letter for the current game state."""
+        if self.tree is not None:
+            letter = self.tree.best_guess(game_logic)
+            if letter:
+                with self.lock:
+                    self.result = (game_logic.guessed_mask, letter)
+                return
+        snapshot = game_snapshot(game_logic)
+        self.last_snapshot = snapshot
+        self.requests.put((snapshot, True))
+
+    def poll(self, game_logic):
+        """Get a finished hint that still applies to the game, if any.
+
+        Returns:
+            Uppercase letter, or None if no hint is ready
+        """
+        with self.lock:
+            result = self.result
+            if result is None or result[0] != game_logic.guessed_mask:
+                return None
+            self.result = None
+        return result[1]
+
+    def stop(self):
+        """Stop the worker thread."""
+        self.requests.put(None)
+        self.thread.join()
+
+    def work(self):
+        while True:
+            item = self.requests.get()
+            # Skip ahead to the newest snapshot, keeping any hint request
+            wants_hint = False
+            while item is not None:
+                snapshot, hint = item
+                wants_hint = wants_hint or hint
+                try:
+                    item = self.requests.get_nowait()
+                except queue.Empty:
+                    break
+            if item is None:
+                return
+
+            cells, guessed_mask = snapshot
+            self.solver.sync(cells, guessed_mask)
+            if wants_hint:
+                letter = self.solver.best_letter()
+                with self.lock:
+                    self.result = (guessed_mask, letter) if letter else None
@@ -0,0 +1,62 @@
+"""
+Regression tests for WordSelector with difficulty-filtered pools.
+Run from the repository root with `python -m pytest tests`.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+import word_selection  # noqa: E402
+from game_logic import GameLogic  # noqa: E402
+from word_selection import WordSelector  # noqa: E402
+from word_source import DIFFICULTY_BANDS, ListWordSource  # noqa: E402
+
+
+def banded_source():
+    """Built-in words split evenly over the bands, so each pool is much smaller than the window."""
+    source = ListWordSource()
+    source.set_bands(np.arange(len(source)) % len(DIFFICULTY_BANDS))
+    return source
+
+
+def test_repeated_resets_with_a_difficulty_band():
+    source = banded_source()
+    for band_index, band in enumerate(DIFFICULTY_BANDS):
+        pool = {source.word(index) for index in np.flatnonzero(source.bands == band_index)}
+        game = GameLogic(source, band, WordSelector(source, seed=7))
+        words = [game.word]
+        for _ in range(5 * len(pool)):
+            game.reset_game()
+            words.append(game.word)
+        assert set(words) == pool
+        # Every window of len(pool) consecutive games plays the whole pool
+        assert all(len(set(words[start:start + len(pool)])) == len(pool)
+                   for start in range(len(words) - len(pool)))
+
+
+def test_single_word_pool_repeats():
+    source = banded_source()
+    selector = WordSelector(source, seed=7)
+    word = selector.next_word(length=4)
+    assert [selector.next_word(length=4) for _ in range(3)] == [word] * 3
+
+
+
+def test_rare_filter_fallback_keeps_the_bag(monkeypatch):
+    # Send every filtered pick through the fallback that doesn't walk the bag
+    monkeypatch.setattr(word_selection, "MAX_FILTER_STEPS", 1)
+    source = banded_source()
+    for seed in range(20):
+        selector = WordSelector(source, window=0, seed=seed)
+        picks = [selector.next_word(difficulty=band) for band in DIFFICULTY_BANDS * 3]
+        assert len(set(picks)) == len(picks)
+
+
+def test_permutation_inverse():
+    permutation = word_selection.FeistelPermutation(1000, 42)
+    assert sorted(permutation[index] for index in range(1000)) == list(range(1000))
+    assert all(permutation.index_of(permutation[index]) == index for index in range(1000))
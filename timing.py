@@ -0,0 +1,135 @@
+"""
+Timing Module for Hangman Game
+Keeps game time and decides how long the main loop waits between frames.
+
+Game state advances in fixed ticks of 1 / TICK_RATE seconds, counted by
+GameClock from a monotonic clock. Rendering only reads the state, so the
+game behaves the same uncapped, at any frame rate, or with no rendering.
+"""
+
+import math
+import time
+
+import pygame
+from constants import TARGET_FPS, IDLE_FPS, IDLE_AFTER_MS, TICK_RATE, MAX_CATCH_UP_TICKS
+
+
+class GameClock:
+    """Monotonic game clock with fixed-timestep updates."""
+
+    def __init__(self, tick_rate=TICK_RATE, max_catch_up=MAX_CATCH_UP_TICKS, time_source=time.perf_counter):
+        """Initialize the clock at game time 0.
+
+        Args:
+            tick_rate: Game ticks per second
+            max_catch_up: Most ticks one advance() returns beyond the time
+                the loop waited on purpose; time lost to stalls beyond it
+                (e.g. while the window was dragged) is dropped
+            time_source: Monotonic clock in seconds
+        """
+        self.tick_rate = tick_rate
+        self.max_catch_up = max_catch_up
+        self.time_source = time_source
+        self.last = time_source()
+        self.ticks = 0
+        self.remainder = 0.0  # Seconds not yet counted as a whole tick
+
+    def advance(self, waited=0.0):
+        """Count the whole ticks elapsed since the last call.
+
+        Args:
+            waited: Seconds of the elapsed time the loop spent waiting on
+                purpose (FramePacer.waited); they always count, so slow
+                frame rates keep real time
+
+        Returns:
+            Number of ticks to update the game by
+        """
+        now = self.time_source()
+        self.remainder += now - self.last
+        self.last = now
+        ticks = int(self.remainder * self.tick_rate)
+        self.remainder -= ticks / self.tick_rate
+        limit = self.max_catch_up + math.ceil(waited * self.tick_rate)
+        if ticks > limit:
+            ticks = limit
+        self.ticks += ticks
+        return ticks
+
+    def step(self, ticks=1):
+        """Advance by a fixed number of ticks without reading the clock,
+        for headless runs and tests.
+
+        Returns:
+            ticks
+        """
+        self.ticks += ticks
+        return ticks
+
+    @property
+    def time(self):
+        """Game time in seconds, for animations."""
+        return (self.ticks + self.remainder * self.tick_rate) / self.tick_rate
+
+
+class FramePacer:
+    """Paces the main loop, slowing down while nobody is playing.
+
+    At full rate the loop runs at `fps`. With adaptive pacing, once there has
+    been no input for `idle_after_ms` and nothing on screen is counting down,
+    each frame instead blocks in pygame.event.wait() until the next event
+    arrives or one idle frame has passed. Any event brings the loop straight
+    back to full rate. An idle_fps of 0 stops animating entirely and sleeps
+    until input arrives."""
+
+    def __init__(self, fps=TARGET_FPS, idle_fps=IDLE_FPS, idle_after_ms=IDLE_AFTER_MS, adaptive=True):
+        """Initialize the pacer.
+
+        Args:
+            fps: Frame rate while the game is in use
+            idle_fps: Frame rate while idle, 0 to only wake up on input
+            idle_after_ms: Milliseconds without input before idling
+            adaptive: Idle when possible; False always runs at fps
+        """
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.idle_after_ms = idle_after_ms
+        self.adaptive = adaptive
+        self.last_input = pygame.time.get_ticks()
+        self.idle = False
+        self.waited = 0.0  # Seconds the last wait() took
+
+    def note_events(self, events):
+        """Record the events handled this frame; any event counts as input."""
+        if events:
+            self.last_input = pygame.time.get_ticks()
+            self.idle = False
+
+    def wait(self, busy=False):
+        """Wait until the next frame is due.
+
+        Args:
+            busy: Something on screen is counting down frames (e.g. a
+                message) and needs the full rate
+
+        Returns:
+            The event that ended an idle wait, or None. It was taken off the
+            queue, so handle it before the events still queued behind it
+        """
+        start = time.perf_counter()
+        quiet_for = pygame.time.get_ticks() - self.last_input
+        self.idle = self.adaptive and not busy and quiet_for >= self.idle_after_ms
+        if not self.idle:
+            self.clock.tick(self.fps)
+            self.waited = time.perf_counter() - start
+            return None
+
+        timeout = int(1000 / self.idle_fps) if self.idle_fps else 0
+        event = pygame.event.wait(timeout)
+        self.clock.tick()
+        self.waited = time.perf_counter() - start
+        if event.type == pygame.NOEVENT:
+            return None
+        self.note_events([event])
+        return event
@@ -7,115 +7,267 @@ import pygame
 import random
 import math
 import time
+from collections import OrderedDict
+
+import numpy as np
+
 from constants import *
+from game_logic import ALPHABET, GAME_RESET, LETTER_GUESSED
+from profiler import NullProfiler
 
 class FontManager:
     """Manages all fonts used in the game"""
     
-    def __init__(self):
+    def __init__(self, cache_size=TEXT_CACHE_SIZE):
         self.title_font = pygame.font.SysFont("arial", 48, bold=True)
         self.word_font = pygame.font.SysFont("consolas", 42, bold=True)
         self.button_font = pygame.font.SysFont("arial", 28)
         self.message_font = pygame.font.SysFont("arial", 36, bold=True)
         self.info_font = pygame.font.SysFont("arial", 22)
 
+        # Rendered text surfaces, least recently used first
+        self.cache_size = cache_size
+        self.text_cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """Render text, reusing the surface from an earlier identical call.
+
+        Args:
+            font: One of this manager's fonts
+            text: String to render
+            color: RGB text color
+            antialias: Smooth the glyph edges
+
+        Returns:
+            Surface with the text; it is shared, so callers must not draw on it
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.text_cache.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.text_cache[key] = surface
+        if len(self.text_cache) > self.cache_size:
+            self.text_cache.popitem(last=False)
+        return surface
+
+
+# Drawing primitives, with points relative to the gallows center:
+# ("line", start, end, width), ("circle", center, radius, width) and
+# ("arc", rect, start angle, stop angle, width); width 0 fills the circle
+GALLOWS = [
+    ("line", (-100, 200), (100, 200), 8),
+    ("line", (0, 200), (0, -150), 8),
+    ("line", (0, -150), (100, -150), 8),
+    ("line", (100, -150), (100, -100), 8),
+]
+
+# Parts of the figure in the order they appear, each a list of primitives
+HANGMAN_PARTS = [
+    [("circle", (100, -60), 40, 4)],  # Head
+    [("line", (100, -20), (100, 60), 6)],  # Body
+    [("line", (100, 0), (140, -30), 6)],  # Left Arm
+    [("line", (100, 0), (60, -30), 6)],  # Right Arm
+    [("line", (100, 60), (60, 100), 6)],  # Left Leg
+    [("line", (100, 60), (140, 100), 6)],  # Right Leg
+    [("arc", (80, -70, 40, 30), 0, math.pi, 3),  # Sad Face
+     ("circle", (85, -70), 3, 0),
+     ("circle", (115, -70), 3, 0)],
+]
+
 
 class HangmanRenderer:
-    """Handles drawing the hangman figure"""
-    
+    """Handles drawing the hangman figure
+
+    The figure is data: stage s of a game shows the first
+    len(parts) * s // max_mistakes parts, so the parts are spread over any
+    mistake limit. Each stage is rasterized once per screen size and then
+    drawn with a single blit."""
+
+    def __init__(self, parts=HANGMAN_PARTS, max_mistakes=MAX_MISTAKES):
+        self.parts = parts
+        self.max_mistakes = max_mistakes
+        self.stage_size = None
+        self.stages = {}
+
+    @staticmethod
+    def center(width, height):
+        return width // 6, height // 3 - 20
+
+    @staticmethod
+    def bounds(width, height):
+        """Get the screen area covered by the gallows and a full figure."""
+        center_x, center_y = HangmanRenderer.center(width, height)
+        return pygame.Rect(center_x - 104, center_y - 154, 248, 358)
+
+    @staticmethod
+    def draw_primitives(surface, primitives, color, origin):
+        """Draw primitives with their points offset by origin."""
+        x, y = origin
+        for kind, *geometry in primitives:
+            if kind == "line":
+                (x1, y1), (x2, y2), width = geometry
+                pygame.draw.line(surface, color, (x + x1, y + y1), (x + x2, y + y2), width)
+            elif kind == "circle":
+                (cx, cy), radius, width = geometry
+                pygame.draw.circle(surface, color, (x + cx, y + cy), radius, width)
+            elif kind == "arc":
+                (left, top, arc_width, arc_height), start, stop, width = geometry
+                pygame.draw.arc(surface, color, (x + left, y + top, arc_width, arc_height), start, stop, width)
+
     @staticmethod
-    def draw_hangman(surface, mistakes, width, height):
-        center_x, center_y = width // 6, height // 3 - 20
-        radius = 40
-
-        # Draw gallows
-        pygame.draw.line(surface, ACCENT, (center_x - 100, center_y + 200), 
-                        (center_x + 100, center_y + 200), 8)
-        pygame.draw.line(surface, ACCENT, (center_x, center_y + 200), 
-                        (center_x, center_y - 150), 8)
-        pygame.draw.line(surface, ACCENT, (center_x, center_y - 150), 
-                        (center_x + 100, center_y - 150), 8)
-        pygame.draw.line(surface, ACCENT, (center_x + 100, center_y - 150), 
-                        (center_x + 100, center_y - 100), 8)
-
-        if mistakes > 0:  # Head
-            pygame.draw.circle(surface, TEXT_COLOR, (center_x + 100, center_y - 60), radius, 4)
-            
-        if mistakes > 1:  # Body
-            pygame.draw.line(surface, TEXT_COLOR, (center_x + 100, center_y - 20), 
-                           (center_x + 100, center_y + 60), 6)
-
-        if mistakes > 2:  # Left Arm
-            pygame.draw.line(surface, TEXT_COLOR, (center_x + 100, center_y), 
-                           (center_x + 140, center_y - 30), 6)
-
-        if mistakes > 3:  # Right Arm
-            pygame.draw.line(surface, TEXT_COLOR, (center_x + 100, center_y), 
-                           (center_x + 60, center_y - 30), 6)
-
-        if mistakes > 4:  # Left Leg
-            pygame.draw.line(surface, TEXT_COLOR, (center_x + 100, center_y + 60), 
-                           (center_x + 60, center_y + 100), 6)
-
-        if mistakes > 5:  # Right Leg
-            pygame.draw.line(surface, TEXT_COLOR, (center_x + 100, center_y + 60), 
-                           (center_x + 140, center_y + 100), 6)
-
-        if mistakes > 6:  # Sad Face
-            pygame.draw.arc(surface, TEXT_COLOR, (center_x + 80, center_y - 70, 40, 30), 
-                           0, math.pi, 3)
-            pygame.draw.circle(surface, TEXT_COLOR, (center_x + 85, center_y - 70), 3)
-            pygame.draw.circle(surface, TEXT_COLOR, (center_x + 115, center_y - 70), 3)
+    def draw_gallows(surface, width, height, color=ACCENT):
+        HangmanRenderer.draw_primitives(surface, GALLOWS, color, HangmanRenderer.center(width, height))
+
+    def visible_parts(self, mistakes):
+        """Get how many figure parts show after a number of mistakes."""
+        return len(self.parts) * min(mistakes, self.max_mistakes) // self.max_mistakes
+
+    def stage(self, mistakes, width, height):
+        """Get the cached figure surface for a number of mistakes.
+
+        Returns:
+            Surface covering bounds(), or None while no part shows
+        """
+        if self.stage_size != (width, height):
+            self.stage_size = (width, height)
+            self.stages = {}
+        count = self.visible_parts(mistakes)
+        if not count:
+            return None
+        if count not in self.stages:
+            bounds = self.bounds(width, height)
+            center_x, center_y = self.center(width, height)
+            stage = pygame.Surface(bounds.size)
+            if pygame.display.get_surface() is not None:
+                stage = stage.convert()
+            stage.fill((0, 0, 0))
+            origin = (center_x - bounds.x, center_y - bounds.y)
+            for part in self.parts[:count]:
+                self.draw_primitives(stage, part, TEXT_COLOR, origin)
+            stage.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            self.stages[count] = stage
+        return self.stages[count]
+
+    def draw_figure(self, surface, mistakes, width, height):
+        stage = self.stage(mistakes, width, height)
+        if stage is not None:
+            surface.blit(stage, self.bounds(width, height))
+
+
+# Looks a button can be drawn in, one atlas column each
+BUTTON_STATES = ("normal", "hover", "correct", "wrong", "disabled")
 
 
 class Button:
-    """Represents a clickable button"""
+    """Represents a clickable button, drawn and hit-tested by ButtonManager"""
     
     def __init__(self, x, y, width, height, text, color=BUTTON_COLOR, hover_color=BUTTON_HOVER):
         self.rect = pygame.Rect(x, y, width, height)
+        self.base_color = color
         self.color = color
         self.hover_color = hover_color
         self.text = text
         self.visible = True
         self.clicked = False
 
-    def is_hovered(self):
-        return self.rect.collidepoint(pygame.mouse.get_pos())
-
-    def draw(self, surface, font):
-        if not self.visible:
-            return
-
-        color = self.hover_color if self.is_hovered() and not self.clicked else self.color
-
-        pygame.draw.rect(surface, color, self.rect, border_radius=8)
-        pygame.draw.rect(surface, ACCENT, self.rect, 3, border_radius=8)
+    def state(self, hovered=False):
+        """Get the BUTTON_STATES entry to draw the button in.
 
-        text_surf = font.render(self.text, True, TEXT_COLOR)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        Args:
+            hovered: Whether the mouse is over the button
 
-    def handle_event(self, event):
+        Returns:
+            State name, or None if the button is hidden
+        """
         if not self.visible:
-            return False
-
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.is_hovered():
-                self.clicked = True
-                return True
-
-        return False
+            return None
+        if self.clicked:
+            return "disabled"
+        if self.color == GREEN:
+            return "correct"
+        if self.color == RED:
+            return "wrong"
+        return "hover" if hovered else "normal"
+
+    def state_colors(self, state):
+        """Get the (fill, text) colors of a state."""
+        fills = {"normal": self.base_color, "hover": self.hover_color, "correct": GREEN, "wrong": RED,
+                 "disabled": self.base_color}
+        return fills[state], DISABLED_TEXT if state == "disabled" else TEXT_COLOR
+
+
+class ButtonAtlas:
+    """Every button pre-rendered in every state on one surface.
+
+    Each button gets a row with one cell per BUTTON_STATES entry, so drawing
+    any number of buttons is a single Surface.blits() call."""
+
+    def __init__(self, fonts, buttons):
+        cell_width = max(button.rect.width for button in buttons)
+        cell_height = max(button.rect.height for button in buttons)
+        self.surface = pygame.Surface((cell_width * len(BUTTON_STATES), cell_height * len(buttons)))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self.surface.fill((0, 0, 0))
+        self.areas = {}
+
+        for row, button in enumerate(buttons):
+            for column, state in enumerate(BUTTON_STATES):
+                area = pygame.Rect(column * cell_width, row * cell_height, *button.rect.size)
+                fill, text_color = button.state_colors(state)
+                pygame.draw.rect(self.surface, fill, area, border_radius=8)
+                pygame.draw.rect(self.surface, ACCENT, area, 3, border_radius=8)
+                text_surf = fonts.render(fonts.button_font, button.text, text_color)
+                self.surface.blit(text_surf, text_surf.get_rect(center=area.center))
+                self.areas[button.text, state] = area
+
+        # The rounded corners stay see-through. No RLEACCEL: blitting parts of
+        # an RLE surface has to skip through its runs and is several times slower
+        self.surface.set_colorkey((0, 0, 0))
 
 
 class ButtonManager:
-    """Manages all letter buttons"""
+    """Manages all letter buttons
+
+    The blit sequence drawing the buttons is kept between frames and only
+    rebuilt when a button changes state or the mouse moves onto another
+    button."""
     
-    def __init__(self, fonts, width, height):
+    def __init__(self, fonts, width, height, labels=ALPHABET):
+        """Lay out one button per label, plus the hint button.
+
+        Args:
+            fonts: FontManager to render the labels with
+            width: Screen width
+            height: Screen height
+            labels: Button labels in grid order, one letter each by default
+        """
         self.fonts = fonts
         self.width = width
         self.height = height
+        self.labels = labels
         self.buttons = []
+        self.game_logic = None
+        self.blit_sequence = None
+        self.blit_hovered = None
+        self.create_buttons()
+
+    def resize(self, width, height):
+        """Lay the buttons out for a new screen size, keeping their states."""
+        states = {button.text: (button.visible, button.clicked, button.color) for button in self.buttons}
+        self.width = width
+        self.height = height
         self.create_buttons()
+        for button in self.buttons:
+            button.visible, button.clicked, button.color = states[button.text]
+        self.invalidate()
 
     def create_buttons(self):
         self.buttons = []
@@ -123,20 +275,62 @@ class ButtonManager:
         start_y = self.height // 2 - 80
         spacing = 45
 
-        # Create A-Z buttons
-        for i in range(26):
-            letter = chr(65 + i)
-            row = i // 9
-            col = i % 9
+        # Grid layout, also used to find the button under a point
+        self.grid_origin = (start_x, start_y)
+        self.grid_spacing = spacing
+        self.grid_columns = 9
+        self.button_size = 40
+
+        # One button per label, then the hint button in the next free cell
+        for i, label in enumerate(tuple(self.labels) + (HINT_LABEL,)):
+            row = i // self.grid_columns
+            col = i % self.grid_columns
             x = start_x + col * spacing
             y = start_y + row * spacing
-            self.buttons.append(Button(x, y, 40, 40, letter))
+            self.buttons.append(Button(x, y, self.button_size, self.button_size, label))
+
+        self.by_text = {button.text: button for button in self.buttons}
+        self.atlas = ButtonAtlas(self.fonts, self.buttons)
+        self.invalidate()
+
+    def watch(self, game_logic):
+        """Keep the buttons in sync with a game through its change notifications."""
+        if game_logic is self.game_logic:
+            return
+        if self.game_logic is not None:
+            self.game_logic.unsubscribe(self.on_game_event)
+        self.game_logic = game_logic
+        game_logic.subscribe(self.on_game_event)
+        self.reset_buttons()
+        self.update_button_states(game_logic.guessed_letters, game_logic.word)
+
+    def on_game_event(self, event, game_logic, letter=None, correct=None, **details):
+        """Update the buttons for a game change notification.
+
+        Args:
+            event: LETTER_GUESSED, GAME_RESET or STATE_CHANGED
+            game_logic: GameLogic that changed
+            letter: Guessed letter, for LETTER_GUESSED
+            correct: Whether the guessed letter is in the word
+        """
+        if event == GAME_RESET:
+            self.reset_buttons()
+        elif event == LETTER_GUESSED and letter in self.by_text:
+            button = self.by_text[letter]
+            button.visible = False
+            button.color = GREEN if correct else RED
+            self.invalidate()
+
+    def invalidate(self):
+        """Rebuild the blit sequence on the next draw, after a button changed."""
+        self.blit_sequence = None
 
     def reset_buttons(self):
         for button in self.buttons:
             button.visible = True
             button.clicked = False
             button.color = BUTTON_COLOR
+        self.invalidate()
 
     def update_button_states(self, guessed_letters, word):
         for button in self.buttons:
@@ -147,103 +341,310 @@ class ButtonManager:
                     button.color = RED
                 else:
                     button.color = GREEN
+        self.invalidate()
+
+    def button_at(self, pos):
+        """Find the button under a point by grid arithmetic.
+
+        Args:
+            pos: (x, y) screen position
+
+        Returns:
+            The Button whose rect contains pos, or None
+        """
+        x = pos[0] - self.grid_origin[0]
+        y = pos[1] - self.grid_origin[1]
+        if x < 0 or y < 0:
+            return None
+        col, x_offset = divmod(x, self.grid_spacing)
+        row, y_offset = divmod(y, self.grid_spacing)
+        if col >= self.grid_columns or x_offset >= self.button_size or y_offset >= self.button_size:
+            return None  # Right of the grid or in the gap between buttons
+        index = row * self.grid_columns + col
+        return self.buttons[index] if index < len(self.buttons) else None
+
+    def hovered_button(self, mouse_pos=None):
+        """Get the visible button under the mouse, or None."""
+        button = self.button_at(pygame.mouse.get_pos() if mouse_pos is None else mouse_pos)
+        return button if button is not None and button.visible else None
 
     def draw(self, surface):
-        for button in self.buttons:
-            button.draw(surface, self.fonts.button_font)
+        hovered = self.hovered_button()
+        if self.blit_sequence is None or hovered is not self.blit_hovered:
+            atlas, areas = self.atlas.surface, self.atlas.areas
+            self.blit_sequence = []
+            for button in self.buttons:
+                state = button.state(button is hovered)
+                if state:
+                    self.blit_sequence.append((atlas, button.rect, areas[button.text, state]))
+            self.blit_hovered = hovered
+        surface.blits(self.blit_sequence, doreturn=False)
 
     def handle_events(self, event):
-        for button in self.buttons:
-            if button.handle_event(event):
-                return button.text
-        return None
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return None
+        # The click's own position, not where the mouse is by now
+        button = self.button_at(event.pos)
+        if button is None or not button.visible:
+            return None
+        if button.text != HINT_LABEL:
+            button.clicked = True  # The hint button can be used again
+            self.invalidate()
+        return button.text
 
 
 class BackgroundRenderer:
-    """Handles drawing the animated background"""
-    
-    @staticmethod
-    def draw_decorations(surface, width, height):
-        current_time = time.time()
-        
-        # Draw gently moving stars
-        for i in range(100):
-            
-            # Use hash-based deterministic positioning
-            base_x = hash(f"star_x_{i}") % width
-            base_y = hash(f"star_y_{i}") % height
-            
-            x = base_x + int(10 * math.sin(current_time * 3.0 + i * 0.1))
-            y = base_y + int(5 * math.cos(current_time * 2.5 + i * 0.05))
-            
-            # Use hash-based deterministic values for star properties
-            size = 1 + (hash(f"star_size_{i}") % 3)  # Size between 1-3
-            brightness = 150 + (hash(f"star_brightness_{i}") % 106)  # Brightness between 150-255
-            pygame.draw.circle(surface, (brightness, brightness, brightness), (x, y), size)
+    """Handles drawing the animated background
+
+    Star and cloud attributes are drawn from a seeded generator once, so the
+    layout is the same on every run. Each frame their offsets are computed
+    for all stars at once, and the stars are drawn by blitting pre-rendered
+    sprites in one batch."""
+
+    def __init__(self, width, height, star_count=STAR_COUNT, seed=BACKGROUND_SEED):
+        """Lay out the stars and clouds for a screen size.
+
+        Args:
+            width: Screen width
+            height: Screen height
+            star_count: Number of stars
+            seed: Seed of the star and cloud layout
+        """
+        self.width = width
+        self.height = height
+        rng = np.random.default_rng(seed)
 
-        # Draw moon
-        pygame.draw.circle(surface, (255, 255, 255), (width - 100, 100), 50)
+        self.star_x = rng.integers(0, width, star_count)
+        self.star_y = rng.integers(0, height, star_count)
+        self.star_size = rng.integers(1, 4, star_count)  # Size between 1-3
+        brightness = rng.integers(150, 256, star_count)  # Brightness between 150-255
+        self.star_phase_x = np.arange(star_count) * 0.1
+        self.star_phase_y = np.arange(star_count) * 0.05
+
+        # One sprite per (size, brightness); sprite top-left is the center minus size + 1
+        sprites = {}
+        self.star_sprites = [sprites.setdefault(key, self.star_sprite(*key))
+                             for key in zip(self.star_size.tolist(), brightness.tolist())]
+        self.star_offset = self.star_size + 1
+
+        self.cloud_positions = [(width - 300, 80), (width - 600, 120), (width - 900, 90)]
+        self.cloud_size = rng.integers(30, 61, len(self.cloud_positions))  # Size between 30-60
+        self.cloud_brightness = rng.integers(150, 256, len(self.cloud_positions))
 
-        # Draw gently moving clouds
-        
-        cloud_positions = [(width - 300, 80), (width - 600, 120), (width - 900, 90)]
-        for i, (base_x, base_y) in enumerate(cloud_positions):
-            # Use deterministic positioning without affecting global random state
+    @staticmethod
+    def star_sprite(size, brightness):
+        sprite = pygame.Surface((2 * size + 3, 2 * size + 3))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        sprite.fill((0, 0, 0))
+        pygame.draw.circle(sprite, (brightness, brightness, brightness), (size + 1, size + 1), size)
+        sprite.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return sprite
+
+    def star_positions(self, current_time):
+        """Get the sprite positions of all stars for a frame.
+
+        Returns:
+            Tuple of (x, y) integer arrays with each sprite's top-left corner
+        """
+        # Gently moving stars
+        x = self.star_x + np.trunc(10 * np.sin(current_time * 3.0 + self.star_phase_x)).astype(np.int64)
+        y = self.star_y + np.trunc(5 * np.cos(current_time * 2.5 + self.star_phase_y)).astype(np.int64)
+        return x - self.star_offset, y - self.star_offset
+
+    def clouds(self, current_time):
+        """Get the clouds of a frame as (color, rect) pairs."""
+        clouds = []
+        # Gently moving clouds
+        for i, (base_x, base_y) in enumerate(self.cloud_positions):
             x = base_x + int(20 * math.sin(current_time * 1.8 + i * 0.5))
             y = base_y + int(5 * math.sin(current_time * 1.5 + i * 0.3))
-            
-            # Use hash-based deterministic values for cloud properties
-            size = 30 + (hash(f"cloud_{i}") % 31)  # Size between 30-60
-            brightness = 150 + (hash(f"brightness_{i}") % 106)  # Brightness between 150-255
-            pygame.draw.ellipse(surface, (brightness, brightness, brightness), (x, y, size, size * 0.8))
+            size = int(self.cloud_size[i])
+            brightness = int(self.cloud_brightness[i])
+            clouds.append(((brightness, brightness, brightness), (x, y, size, size * 0.8)))
+        return clouds
+
+    def animated_bounds(self, current_time):
+        """Get the screen areas covered by each star and cloud in a frame."""
+        x, y = self.star_positions(current_time)
+        bounds = [pygame.Rect(left, top, 2 * size + 3, 2 * size + 3)
+                  for left, top, size in zip(x.tolist(), y.tolist(), self.star_size.tolist())]
+        bounds.extend(pygame.Rect(rect).inflate(2, 2) for _, rect in self.clouds(current_time))
+        return bounds
+
+    def draw_animated(self, surface, current_time):
+        x, y = self.star_positions(current_time)
+        surface.blits(list(zip(self.star_sprites, zip(x.tolist(), y.tolist()))), doreturn=False)
+        for color, rect in self.clouds(current_time):
+            pygame.draw.ellipse(surface, color, rect)
+
+    @staticmethod
+    def draw_static(surface, width, height, color=ACCENT):
+        """Draw the parts of the background that never move."""
+        # Draw moon
+        pygame.draw.circle(surface, (255, 255, 255), (width - 100, 100), 50)
 
         # Draw border
-        pygame.draw.rect(surface, ACCENT, (10, 10, width - 20, height - 20), 4, border_radius=10)
+        pygame.draw.rect(surface, color, (10, 10, width - 20, height - 20), 4, border_radius=10)
+
+    def draw_decorations(self, surface, current_time=None):
+        """Draw the moving stars and clouds; the moon and border are part of
+        GameRenderer's static layer."""
+        self.draw_animated(surface, time.time() if current_time is None else current_time)
 
 
 class GameRenderer:
     """Handles rendering all game elements"""
     
-    def __init__(self, fonts):
+    def __init__(self, fonts, theme=THEME):
         self.fonts = fonts
+        self.theme = theme
+        self.hangman = HangmanRenderer()
+        self.profiler = NullProfiler()
+        self.static_key = None
+        self.static_surface = None
+        self.game_logic = None
+        self.panel = None
+        self.panel_size = None
+
+    def watch(self, game_logic):
+        """Rebuild the word and status surfaces only when the game changes."""
+        if game_logic is self.game_logic:
+            return
+        if self.game_logic is not None:
+            self.game_logic.unsubscribe(self.on_game_event)
+        self.game_logic = game_logic
+        game_logic.subscribe(self.on_game_event)
+        self.panel = None
 
-    def draw(self, surface, game_logic, button_manager, width, height):
-        # Draw title
-        title = self.fonts.title_font.render("Hangman Game", True, ACCENT)
-        surface.blit(title, (width // 2 - title.get_width() // 2, 50))
+    def on_game_event(self, event, game_logic, **details):
+        """Drop the cached word and status panel after any game change.
+
+        Args:
+            event: LETTER_GUESSED, GAME_RESET or STATE_CHANGED
+            game_logic: GameLogic that changed
+        """
+        self.panel = None
 
-        # Draw hangman
-        HangmanRenderer.draw_hangman(surface, game_logic.mistakes, width, height)
+    def draw(self, surface, game_logic, button_manager, width, height):
+        button_manager.watch(game_logic)
+        self.draw_elements(surface, game_logic, button_manager, width, height)
+
+    def draw_elements(self, surface, game_logic, button_manager, width, height):
+        """Draw every game element without changing any state."""
+        profiler = self.profiler
+        with profiler.stage("draw.static"):  # Title, instructions, gallows, moon and border
+            surface.blit(self.static_layer(width, height), (0, 0))
+        with profiler.stage("draw.hangman"):
+            self.hangman.draw_figure(surface, game_logic.mistakes, width, height)
+        with profiler.stage("draw.word"):
+            self.draw_word(surface, game_logic, width, height)
+        with profiler.stage("draw.message"):
+            self.draw_message(surface, game_logic, width, height)
+            self.draw_status(surface, game_logic, width, height)
+        with profiler.stage("draw.buttons"):
+            button_manager.draw(surface)
+
+    def static_layer(self, width, height):
+        """Get the elements that never change, composed on one surface.
+
+        The title, instructions, gallows, moon and border are drawn once per
+        screen size and theme onto a surface whose background color is
+        transparent, so a frame shows all of them with a single blit.
+        """
+        key = (width, height, self.theme)
+        if key != self.static_key:
+            background, accent, _ = self.theme
+            layer = pygame.Surface((width, height))
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            layer.fill(background)
+            BackgroundRenderer.draw_static(layer, width, height, accent)
+            HangmanRenderer.draw_gallows(layer, width, height, accent)
+            self.draw_title(layer, width)
+            self.draw_instructions(layer, width, height)
+            # Run-length encoding makes the mostly transparent blit cheap
+            layer.set_colorkey(background, pygame.RLEACCEL)
+            self.static_key, self.static_surface = key, layer
+        return self.static_surface
+
+    def message_color(self, game_logic):
+        if game_logic.message.startswith("Hint"):
+            return LIGHT_BLUE
+        return GREEN if 'Good' in game_logic.message or game_logic.game_state == "won" else RED
+
+    def status_text(self, game_logic):
+        """Get the bottom status line as (font, text, color)."""
+        if game_logic.game_state == "won":
+            return self.fonts.message_font, 'You Won! Press SPACE to play again', GREEN
+        if game_logic.game_state == "lost":
+            return self.fonts.message_font, 'You Lost! Press SPACE to play again', RED
+        return self.fonts.info_font, f"Mistakes: {game_logic.mistakes}/{MAX_MISTAKES}", TEXT_COLOR
 
-        # Draw word display
-        display_word = game_logic.get_display_word()
-        word_surf = self.fonts.word_font.render(display_word, True, TEXT_COLOR)
-        surface.blit(word_surf, (width // 2 - word_surf.get_width() // 2, height // 2 - 150))
+    def draw_title(self, surface, width):
+        title = self.fonts.render(self.fonts.title_font, "Hangman Game", self.theme[1])
+        surface.blit(title, (width // 2 - title.get_width() // 2, 50))
 
-        # Draw message
+    def text_panel(self, game_logic, width, height):
+        """Get the word and the status line, ready to blit.
+
+        Returns:
+            Dict mapping "word" and "status" to (state, surface, rect),
+            rebuilt only after a change notification or resize
+        """
+        self.watch(game_logic)
+        if self.panel is None or self.panel_size != (width, height):
+            display_word = game_logic.get_display_word()
+            word_surf = self.fonts.render(self.fonts.word_font, display_word, TEXT_COLOR)
+            font, text, color = self.status_text(game_logic)
+            status_surf = self.fonts.render(font, text, color)
+            self.panel = {
+                "word": (display_word, word_surf,
+                         word_surf.get_rect(topleft=(width // 2 - word_surf.get_width() // 2, height // 2 - 150))),
+                "status": ((text, color), status_surf,
+                           status_surf.get_rect(topleft=(width // 2 - status_surf.get_width() // 2, height - 100))),
+            }
+            self.panel_size = (width, height)
+        return self.panel
+
+    def draw_word(self, surface, game_logic, width, height):
+        _, word_surf, rect = self.text_panel(game_logic, width, height)["word"]
+        surface.blit(word_surf, rect)
+
+    def draw_message(self, surface, game_logic, width, height):
         if game_logic.message and game_logic.message_timer > 0:
-            color = GREEN if 'Good' in game_logic.message or game_logic.game_state == "won" else RED
-            msg_surf = self.fonts.message_font.render(game_logic.message, True, color)
+            msg_surf = self.fonts.render(self.fonts.message_font, game_logic.message, self.message_color(game_logic))
             surface.blit(msg_surf, (width // 2 - msg_surf.get_width() // 2, height // 2 - 200))
-            game_logic.message_timer -= 1
 
-        # Draw game state message
-        if game_logic.game_state == "won":
-            msg = self.fonts.message_font.render('You Won! Press SPACE to play again', True, GREEN)
-            surface.blit(msg, (width // 2 - msg.get_width() // 2, height - 100))
-        elif game_logic.game_state == "lost":
-            msg = self.fonts.message_font.render('You Lost! Press SPACE to play again', True, RED)
-            surface.blit(msg, (width // 2 - msg.get_width() // 2, height - 100))
-        else:
-            msg = self.fonts.info_font.render(f"Mistakes: {game_logic.mistakes}/{MAX_MISTAKES}", True, TEXT_COLOR)
-            surface.blit(msg, (width // 2 - msg.get_width() // 2, height - 100))
+    def draw_status(self, surface, game_logic, width, height):
+        _, msg, rect = self.text_panel(game_logic, width, height)["status"]
+        surface.blit(msg, rect)
+
+    def layout(self, game_logic, button_manager, width, height):
+        """Describe the elements that can change between frames.
 
-        # Draw buttons
-        button_manager.update_button_states(game_logic.guessed_letters, game_logic.word)
-        button_manager.draw(surface)
+        Returns:
+            Dict mapping an element key to (state, screen rect); an element
+            must be redrawn when its state changes
+        """
+        def text_rect(font, text, y):
+            text_width, text_height = font.size(text)
+            return pygame.Rect(width // 2 - text_width // 2, y, text_width, text_height)
 
-        # Draw instructions
-        self.draw_instructions(surface, width, height)
+        elements = {"hangman": (self.hangman.visible_parts(game_logic.mistakes), HangmanRenderer.bounds(width, height))}
+        for key, (state, _, rect) in self.text_panel(game_logic, width, height).items():
+            elements[key] = (state, rect)
+
+        if game_logic.message and game_logic.message_timer > 0:
+            message = (game_logic.message, self.message_color(game_logic))
+            elements["message"] = (message, text_rect(self.fonts.message_font, game_logic.message, height // 2 - 200))
+        else:
+            elements["message"] = (None, None)
+
+        hovered = button_manager.hovered_button()
+        for button in button_manager.buttons:
+            elements["button " + button.text] = (button.state(button is hovered), button.rect)
+        return elements
 
     def draw_instructions(self, surface, width, height):
         instructions = [
@@ -255,6 +656,114 @@ class GameRenderer:
 
         for i, text in enumerate(instructions):
             y_pos = height - 150 - (len(instructions) - 1 - i) * 30
-            color = LIGHT_BLUE if i > 0 else ACCENT
-            instr = self.fonts.info_font.render(text, True, color)
-            surface.blit(instr, (width // 2 - 200, y_pos)) 
\ No newline at end of file
+            color = self.theme[2] if i > 0 else self.theme[1]
+            instr = self.fonts.render(self.fonts.info_font, text, color)
+            surface.blit(instr, (width // 2 - 200, y_pos))
+
+
+def merge_rects(rects):
+    """Union overlapping rects until none overlap.
+
+    The overlay is blended onto the screen once per dirty rect, so an area
+    covered by two rects would be blended twice.
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRectRenderer:
+    """Renders frames by updating only the screen areas that changed.
+
+    The static layer and all game elements live on a transparent overlay
+    that is redrawn, clipped, only where an element changed. Each frame the
+    moving stars and clouds are erased and redrawn in place, the overlay is
+    blitted back over just those areas, and only they are sent to the
+    display with pygame.display.update(). With more than
+    DIRTY_RECT_LIMIT moving shapes tracking them costs more than it saves,
+    so every frame is presented whole."""
+
+    def __init__(self, game_renderer, background, width, height):
+        self.game_renderer = game_renderer
+        self.background = background
+        self.width = width
+        self.height = height
+        self.overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.elements = {}
+        self.shape_bounds = []
+        self.needs_full_redraw = True
+
+    def invalidate(self):
+        """Force the next frame to redraw and present the whole screen."""
+        self.needs_full_redraw = True
+
+    def redraw_overlay(self, game_logic, button_manager, area=None):
+        self.overlay.set_clip(area)
+        self.overlay.fill((0, 0, 0, 0))
+        self.game_renderer.draw_elements(self.overlay, game_logic, button_manager, self.width, self.height)
+        self.overlay.set_clip(None)
+
+    def update_overlay(self, elements, game_logic, button_manager):
+        """Redraw the overlay where elements changed since the last frame.
+
+        Returns:
+            List of the changed areas, each element at its old and new place
+        """
+        changed = []
+        for key, (state, rect) in elements.items():
+            old_state, old_rect = self.elements.get(key, (None, None))
+            if state != old_state:
+                changed.extend(area for area in (old_rect, rect) if area)
+        for area in changed:
+            self.redraw_overlay(game_logic, button_manager, area)
+        return changed
+
+    def render(self, screen, game_logic, button_manager, current_time=None):
+        """Draw and present one frame.
+
+        Args:
+            screen: The display surface
+            game_logic: GameLogic instance
+            button_manager: ButtonManager instance
+            current_time: Game time in seconds for the animation, defaults
+                to the wall clock
+
+        Returns:
+            List of the rects that were updated on the display
+        """
+        button_manager.watch(game_logic)
+        elements = self.game_renderer.layout(game_logic, button_manager, self.width, self.height)
+        current_time = time.time() if current_time is None else current_time
+        track_shapes = len(self.background.star_sprites) <= DIRTY_RECT_LIMIT
+        shape_bounds = self.background.animated_bounds(current_time) if track_shapes else []
+
+        if self.needs_full_redraw or not track_shapes:
+            if self.needs_full_redraw:
+                self.redraw_overlay(game_logic, button_manager)
+            else:
+                self.update_overlay(elements, game_logic, button_manager)
+            screen.fill(BACKGROUND)
+            self.background.draw_animated(screen, current_time)
+            screen.blit(self.overlay, (0, 0))
+            dirty = [screen.get_rect()]
+            self.needs_full_redraw = False
+        else:
+            changed = self.update_overlay(elements, game_logic, button_manager)
+
+            # Moving shapes, covering where each was and where it is now
+            dirty = merge_rects([old.union(new) for old, new in zip(self.shape_bounds, shape_bounds)] + changed)
+            for area in dirty:
+                screen.fill(BACKGROUND, area)
+            self.background.draw_animated(screen, current_time)
+            screen.blits([(self.overlay, area, area) for area in dirty], doreturn=False)
+
+        self.elements = elements
+        self.shape_bounds = shape_bounds
+        pygame.display.update(dirty)
+        return dirty
@@ -0,0 +1,243 @@
+"""
+Word Selection Module for Hangman Game
+Picks words without repeats, straight from the word source.
+
+Instead of shuffling a list of every word, the selector walks a keyed
+pseudo-random permutation of the word ids: word n of a session is
+permutation(n), computed on demand with a small Feistel network. A whole
+dictionary is played through before any word comes back, memory use doesn't
+depend on the dictionary size, and the only state to persist between runs is
+the permutation seed, the position and a short window of recent picks.
+"""
+
+import datetime
+import hashlib
+import itertools
+import json
+import os
+import random
+from collections import deque
+
+from word_source import DIFFICULTY_BANDS
+
+FEISTEL_ROUNDS = 4
+
+# Permutation steps tried when looking for a word matching a filter
+MAX_FILTER_STEPS = 10_000
+
+
+def keyed_hash(*parts):
+    """Hash the parts into a 64-bit integer, stable across runs."""
+    data = ":".join(str(part) for part in parts).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class FeistelPermutation:
+    """Keyed bijection on range(size), evaluated one value at a time."""
+
+    def __init__(self, size, key):
+        self.size = size
+        self.key = key
+        self.half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self.half_mask = (1 << self.half_bits) - 1
+
+    def encrypt(self, value):
+        left, right = value >> self.half_bits, value & self.half_mask
+        for round_number in range(FEISTEL_ROUNDS):
+            left, right = right, left ^ (keyed_hash(self.key, round_number, right) & self.half_mask)
+        return (left << self.half_bits) | right
+
+    def decrypt(self, value):
+        left, right = value >> self.half_bits, value & self.half_mask
+        for round_number in reversed(range(FEISTEL_ROUNDS)):
+            left, right = right ^ (keyed_hash(self.key, round_number, left) & self.half_mask), left
+        return (left << self.half_bits) | right
+
+    def __getitem__(self, index):
+        # Cycle-walk until the value falls back into range(size)
+        value = self.encrypt(index)
+        while value >= self.size:
+            value = self.encrypt(value)
+        return value
+
+    def index_of(self, value):
+        """Get the index the permutation maps to value, the inverse of [].
+
+        Args:
+            value: Value in range(size)
+
+        Returns:
+            Index in range(size)
+        """
+        index = self.decrypt(value)
+        while index >= self.size:
+            index = self.decrypt(index)
+        return index
+
+
+class WordSelector:
+    """No-repeat word picker over a WordSource.
+
+    Every word is picked once before any word repeats (a shuffle bag), and
+    the last `window` picks are also kept out across bag refills. With a
+    state_path the bag position survives restarts. In daily mode every pick
+    is the word of the day."""
+
+    def __init__(self, word_source, state_path=None, window=50, seed=None, daily=False):
+        """Initialize the selector.
+
+        Args:
+            word_source: WordSource to pick from
+            state_path: Optional JSON file to persist the selection state in
+            window: Number of recent picks that can't come back, even after
+                every word has been played
+            seed: Seed of the first bag, random by default
+            daily: Always pick the word of the day
+        """
+        self.word_source = word_source
+        self.daily = daily
+        self.state_path = state_path
+        self.window = min(window, len(word_source) - 1)
+        self.fingerprint_hex = None
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.position = 0
+        self.taken_ahead = set()  # Ids picked out of order, past position in this bag
+        self.recent = deque(maxlen=max(self.window, 1))
+        if state_path:
+            self.load_state()
+        self.permutation = FeistelPermutation(len(word_source), self.seed)
+
+    @property
+    def fingerprint(self):
+        """Hex digest of the dictionary, only computed for saved state and
+        daily words since it reads the whole dictionary file."""
+        if self.fingerprint_hex is None:
+            self.fingerprint_hex = self.word_source.fingerprint().hex()
+        return self.fingerprint_hex
+
+    def load_state(self):
+        try:
+            with open(self.state_path) as handle:
+                state = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if state.get("fingerprint") != self.fingerprint:
+            return  # Different dictionary, start a fresh bag
+        self.seed = state["seed"]
+        self.position = state["position"]
+        self.recent.extend(state["recent"])
+        self.taken_ahead.update(state.get("taken_ahead", ()))
+
+    def save_state(self):
+        state = {"fingerprint": self.fingerprint, "seed": self.seed,
+                 "position": self.position, "recent": list(self.recent), "taken_ahead": sorted(self.taken_ahead)}
+        temporary = self.state_path + ".tmp"
+        with open(temporary, "w") as handle:
+            json.dump(state, handle)
+        os.replace(temporary, self.state_path)
+
+    def next_id(self):
+        """Take the next word id out of the bag, refilling it when empty."""
+        while True:
+            if self.position >= len(self.word_source):
+                self.refill()
+            index = self.permutation[self.position]
+            self.position += 1
+            if index not in self.taken_ahead:
+                return index
+            self.taken_ahead.discard(index)  # Already played in this bag
+
+    def refill(self):
+        self.seed = keyed_hash(self.seed, "refill")
+        self.permutation = FeistelPermutation(len(self.word_source), self.seed)
+        self.position = 0
+        self.taken_ahead.clear()
+
+    def take_matching(self, pool, excluded):
+        """Take a matching word out of the bag without walking to it.
+
+        Used for filters too rare to reach by walking the bag. Picks a word
+        of the pool that is still in the bag and outside the window,
+        refilling the bag once every word of the pool has been played.
+
+        Args:
+            pool: int64 array of the ids matching the filters
+            excluded: Ids of the recent picks kept out
+
+        Returns:
+            Word id
+        """
+        for _ in range(2):
+            start = random.randrange(len(pool))
+            for offset in range(len(pool)):
+                index = int(pool[(start + offset) % len(pool)])
+                if index in excluded or index in self.taken_ahead:
+                    continue
+                if self.permutation.index_of(index) >= self.position:
+                    self.taken_ahead.add(index)
+                    return index
+            self.refill()
+        raise AssertionError("The window always leaves a word of the pool")
+
+    def matches(self, index, length, difficulty):
+        if length is not None and self.word_source.lengths[index] != length:
+            return False
+        if difficulty is not None and self.word_source.bands[index] != difficulty:
+            return False
+        return True
+
+    def next_word(self, length=None, difficulty=None):
+        """Pick the next word that hasn't been played recently.
+
+        When fewer words match the filters than the window holds, only the
+        newest picks are kept out, so there is always a word left to play.
+
+        Args:
+            length: Optional exact word length
+            difficulty: Optional difficulty band name
+
+        Returns:
+            Uppercase word
+
+        Raises:
+            ValueError: If no word matches the filters
+        """
+        if self.daily:
+            return self.daily_word()
+
+        band = DIFFICULTY_BANDS.index(difficulty) if difficulty is not None else None
+        if length is None and band is None:
+            pool = None
+            window = self.window
+        else:
+            pool = self.word_source.matching_ids(length, difficulty)
+            if not len(pool):
+                raise ValueError(f"No word with length={length} and difficulty={difficulty}")
+            window = min(self.window, len(pool) - 1)
+        excluded = set(itertools.islice(reversed(self.recent), window))
+
+        for _ in range(MAX_FILTER_STEPS):
+            index = self.next_id()
+            if index not in excluded and self.matches(index, length, band):
+                break
+        else:
+            if pool is None:
+                pool = self.word_source.matching_ids()
+            index = self.take_matching(pool, excluded)
+
+        self.recent.append(index)
+        if self.state_path:
+            self.save_state()
+        return self.word_source.word(index)
+
+    def daily_word(self, date=None):
+        """Get the word of the day, the same for everyone with this dictionary.
+
+        Args:
+            date: datetime.date, defaults to today
+
+        Returns:
+            Uppercase word
+        """
+        date = date or datetime.date.today()
+        return self.word_source.word(keyed_hash("daily", self.fingerprint, date.isoformat()) % len(self.word_source))
@@ -0,0 +1,343 @@
+"""
+Word Source Module for Hangman Game
+Provides the words the game is played with, from the built-in list or from
+large dictionary files.
+
+A dictionary file holds one word per line. It is memory-mapped and indexed by
+a single vectorized scan whose result is cached next to the file, so opening a
+dictionary with millions of words never turns them all into Python strings.
+Words are decoded one at a time, when they are picked.
+"""
+
+import hashlib
+import mmap
+import os
+import random
+import struct
+
+import numpy as np
+
+from constants import WORDS
+from game_logic import word_mask
+
+# Difficulty bands words can be filtered by, easiest first
+DIFFICULTY_BANDS = ("easy", "medium", "hard")
+
+# Longest word accepted from a dictionary file
+MAX_WORD_LENGTH = 32
+
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"HMIDX001"
+INDEX_HEADER = struct.Struct("<8sQqQ")  # magic, file size, mtime (ns), word count
+
+
+def popcount(masks):
+    """Count the set bits of every value in a uint32 mask array."""
+    return np.unpackbits(masks.astype("<u4").view(np.uint8)).reshape(-1, 32).sum(axis=1)
+
+
+def heuristic_bands(masks):
+    """Estimate difficulty bands from the number of distinct letters.
+
+    Words with few distinct letters give a guesser few chances to hit, so
+    they are rated harder. This is only a rough default until the words have
+    been scored.
+
+    Args:
+        masks: uint32 array of per-word letter masks
+
+    Returns:
+        uint8 array of indices into DIFFICULTY_BANDS
+    """
+    distinct = popcount(masks)
+    return np.where(distinct >= 8, 0, np.where(distinct >= 6, 1, 2)).astype(np.uint8)
+
+
+class GroupIndex:
+    """Groups word ids by a small integer key for constant time sampling."""
+
+    def __init__(self, keys, key_count):
+        self.order = np.argsort(keys, kind="stable").astype(np.int64)
+        counts = np.bincount(keys, minlength=key_count)
+        self.starts = np.concatenate(([0], np.cumsum(counts)))
+
+    def span(self, first_key, last_key):
+        """Get the [start, end) range of order covering keys first..last."""
+        return int(self.starts[first_key]), int(self.starts[last_key + 1])
+
+
+class WordSource:
+    """Interface for the words the game is played with.
+
+    Subclasses provide word() and the per-word lengths and masks arrays;
+    filtering and random selection are shared."""
+
+    lengths = None  # uint8 array of word lengths
+    masks = None    # uint32 array of word letter masks
+    band_array = None
+    length_index = None
+    band_index = None
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def word(self, index):
+        """Get the uppercase word with the given id."""
+        raise NotImplementedError
+
+    def fingerprint(self):
+        """Get a digest identifying the dictionary's contents.
+
+        Files derived from a dictionary (decision trees, difficulty caches)
+        store it to notice when the dictionary changed.
+
+        Returns:
+            16-byte digest
+        """
+        raise NotImplementedError
+
+    def letter_matrix(self, ids, length):
+        """Get the letters of equally long words as a byte matrix.
+
+        Args:
+            ids: Array of word ids, all of the given length
+            length: Length of the words
+
+        Returns:
+            uint8 array of shape (len(ids), length) with letter indices (0 = A)
+        """
+        raise NotImplementedError
+
+    @property
+    def bands(self):
+        """uint8 array of per-word difficulty bands (indices into DIFFICULTY_BANDS)."""
+        if self.band_array is None:
+            self.band_array = heuristic_bands(self.masks)
+        return self.band_array
+
+    def set_bands(self, bands):
+        """Replace the per-word difficulty bands, e.g. with scored ones."""
+        self.band_array = np.asarray(bands, dtype=np.uint8)
+        self.length_index = None
+        self.band_index = None
+
+    def build_indexes(self):
+        """Build the length and difficulty group indexes on first use."""
+        band_count = len(DIFFICULTY_BANDS)
+        length_keys = self.lengths.astype(np.int64) * band_count + self.bands
+        self.length_index = GroupIndex(length_keys, (MAX_WORD_LENGTH + 1) * band_count)
+        self.band_index = GroupIndex(self.bands, band_count)
+
+    def filter_span(self, length=None, difficulty=None):
+        """Find the words matching the filters in the group indexes.
+
+        Args:
+            length: Optional exact word length
+            difficulty: Optional name from DIFFICULTY_BANDS, at least one
+                of the two filters must be given
+
+        Returns:
+            Tuple of (GroupIndex, start, end); the word ids are
+            group.order[start:end]
+        """
+        if self.length_index is None:
+            self.build_indexes()
+        band_count = len(DIFFICULTY_BANDS)
+        band = DIFFICULTY_BANDS.index(difficulty) if difficulty is not None else None
+        if length is None:
+            return (self.band_index,) + self.band_index.span(band, band)
+        if not 0 < length <= MAX_WORD_LENGTH:
+            return self.length_index, 0, 0
+        if band is None:
+            first_key, last_key = length * band_count, length * band_count + band_count - 1
+        else:
+            first_key = last_key = length * band_count + band
+        return (self.length_index,) + self.length_index.span(first_key, last_key)
+
+    def ids_with_length(self, length):
+        """Get the ids of all words with the given length.
+
+        Returns:
+            int64 array of word ids
+        """
+        return self.matching_ids(length)
+
+    def matching_ids(self, length=None, difficulty=None):
+        """Get the ids of all words matching the filters.
+
+        Args:
+            length: Optional exact word length
+            difficulty: Optional name from DIFFICULTY_BANDS
+
+        Returns:
+            int64 array of word ids, a view into the group indexes
+        """
+        if length is None and difficulty is None:
+            return np.arange(len(self), dtype=np.int64)
+        group, start, end = self.filter_span(length, difficulty)
+        return group.order[start:end]
+
+    def random_word(self, length=None, difficulty=None, rng=random):
+        """Pick a random word in constant time.
+
+        Args:
+            length: Optional exact word length
+            difficulty: Optional name from DIFFICULTY_BANDS
+            rng: Random number generator with a randrange() method
+
+        Returns:
+            Uppercase word
+
+        Raises:
+            ValueError: If no word matches the filters
+        """
+        if length is None and difficulty is None:
+            return self.word(rng.randrange(len(self)))
+
+        group, start, end = self.filter_span(length, difficulty)
+        if start == end:
+            raise ValueError(f"No word with length={length} and difficulty={difficulty}")
+        return self.word(int(group.order[start + rng.randrange(end - start)]))
+
+
+class ListWordSource(WordSource):
+    """Word source backed by an in-memory list, the built-in WORDS by default."""
+
+    def __init__(self, words=WORDS):
+        self.words = [word.upper() for word in words]
+        self.lengths = np.array([len(word) for word in self.words], dtype=np.uint8)
+        self.masks = np.array([word_mask(word) for word in self.words], dtype=np.uint32)
+
+    def word(self, index):
+        return self.words[index]
+
+    def fingerprint(self):
+        return hashlib.blake2b("\n".join(self.words).encode("ascii"), digest_size=16).digest()
+
+    def letter_matrix(self, ids, length):
+        data = "".join(self.words[index] for index in ids).encode("ascii")
+        return (np.frombuffer(data, dtype=np.uint8).reshape(len(ids), length) - 65).astype(np.uint8)
+
+    def random_word(self, length=None, difficulty=None, rng=random):
+        if length is None and difficulty is None:
+            return rng.choice(self.words)
+        return super().random_word(length, difficulty, rng)
+
+
+class FileWordSource(WordSource):
+    """Word source backed by a memory-mapped dictionary file.
+
+    Lines that are empty, longer than MAX_WORD_LENGTH or contain anything
+    but the letters A-Z (either case) are skipped. The index of word offsets,
+    lengths and letter masks is stored in a sidecar file (path + ".idx") that
+    is rebuilt whenever the dictionary's size or modification time changes."""
+
+    def __init__(self, path, cache_index=True):
+        self.path = path
+        with open(path, "rb") as handle:
+            self.data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        stat = os.stat(path)
+        index_path = path + INDEX_SUFFIX
+        if not self.load_index(index_path, stat):
+            self.build_index()
+            if cache_index:
+                try:
+                    self.save_index(index_path, stat)
+                except OSError:
+                    pass  # Read-only location, rebuild the index next time
+
+        if not len(self.lengths):
+            raise ValueError(f"No valid words in {path}")
+
+    def word(self, index):
+        offset = int(self.offsets[index])
+        return self.data[offset:offset + int(self.lengths[index])].decode("ascii").upper()
+
+    def fingerprint(self):
+        return hashlib.blake2b(self.data, digest_size=16).digest()
+
+    def letter_matrix(self, ids, length):
+        buffer = np.frombuffer(self.data, dtype=np.uint8)
+        positions = np.asarray(self.offsets)[ids][:, None] + np.arange(length)
+        return ((buffer[positions] & 0xDF) - 65).astype(np.uint8)
+
+    def build_index(self):
+        """Scan the mapped file once, without creating per-word strings."""
+        buffer = np.frombuffer(self.data, dtype=np.uint8)
+        newlines = np.flatnonzero(buffer == 10)
+        starts = np.concatenate(([0], newlines + 1))
+        ends = np.concatenate((newlines, [len(buffer)]))
+        if starts[-1] == len(buffer):  # File ends with a newline
+            starts, ends = starts[:-1], ends[:-1]
+
+        # Strip Windows line endings
+        carriage = (ends > starts) & (buffer[np.maximum(ends - 1, 0)] == 13)
+        ends = ends - carriage
+        lengths = ends - starts
+
+        upper = buffer & 0xDF
+        is_letter = (upper >= 65) & (upper <= 90)
+        letter_counts = np.concatenate(([0], np.cumsum(is_letter)))
+        valid = (lengths > 0) & (lengths <= MAX_WORD_LENGTH) & (letter_counts[ends] - letter_counts[starts] == lengths)
+
+        shifts = np.where(is_letter, upper - 65, 0).astype(np.uint32)
+        bits = np.where(is_letter, np.left_shift(np.uint32(1), shifts), 0).astype(np.uint32)
+        masks = np.bitwise_or.reduceat(bits, starts) if len(starts) else np.zeros(0, dtype=np.uint32)
+
+        self.offsets = starts[valid].astype(np.int64)
+        self.lengths = lengths[valid].astype(np.uint8)
+        self.masks = masks[valid].astype(np.uint32)
+
+    def save_index(self, index_path, stat):
+        with open(index_path, "wb") as handle:
+            handle.write(INDEX_HEADER.pack(INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, len(self.offsets)))
+            handle.write(self.offsets.astype("<i8").tobytes())
+            handle.write(self.masks.astype("<u4").tobytes())
+            handle.write(self.lengths.tobytes())
+
+    def load_index(self, index_path, stat):
+        """Memory-map a cached index if it matches the dictionary file.
+
+        Returns:
+            True if the index was loaded, False if it must be rebuilt
+        """
+        try:
+            with open(index_path, "rb") as handle:
+                header = handle.read(INDEX_HEADER.size)
+        except OSError:
+            return False
+        if len(header) != INDEX_HEADER.size:
+            return False
+        magic, size, mtime_ns, count = INDEX_HEADER.unpack(header)
+        if magic != INDEX_MAGIC or size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+            return False
+        if os.path.getsize(index_path) != INDEX_HEADER.size + count * 13:
+            return False
+        if not count:
+            self.offsets = np.zeros(0, dtype=np.int64)
+            self.masks = np.zeros(0, dtype=np.uint32)
+            self.lengths = np.zeros(0, dtype=np.uint8)
+            return True
+
+        offset = INDEX_HEADER.size
+        self.offsets = np.memmap(index_path, dtype="<i8", mode="r", offset=offset, shape=(count,))
+        offset += count * 8
+        self.masks = np.memmap(index_path, dtype="<u4", mode="r", offset=offset, shape=(count,))
+        offset += count * 4
+        self.lengths = np.memmap(index_path, dtype=np.uint8, mode="r", offset=offset, shape=(count,))
+        return True
+
+
+def load_word_source(path=None):
+    """Get the word source for a dictionary file.
+
+    Args:
+        path: Path to a one-word-per-line dictionary, or None for WORDS
+
+    Returns:
+        WordSource instance
+    """
+    if path is None:
+        return ListWordSource()
+    return FileWordSource(path)